@@ -3,6 +3,7 @@
 Core entities for HTML generation and content publishing.
 """
 
+import heapq
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from pathlib import Path
@@ -56,8 +57,7 @@ class SongCollection:
     
     def get_recent_songs(self, limit: int = 5) -> List[SongRequest]:
         """Get the most recent songs (by timestamp)."""
-        sorted_songs = sorted(self.songs, key=lambda s: s.timestamp, reverse=True)
-        return sorted_songs[:limit]
+        return heapq.nlargest(limit, self.songs, key=lambda s: s.timestamp)
 
 
 @dataclass(frozen=True)
@@ -70,7 +70,8 @@ class HtmlPage:
     
     def __post_init__(self):
         """Validate HTML page data."""
-        if not self.content or not self.content.strip():
+        # isspace() checks in place instead of building a stripped copy of the page
+        if not self.content or self.content.isspace():
             raise ValueError("HTML content cannot be empty")
         
         if not self.title or not self.title.strip():
@@ -97,6 +98,7 @@ class PublishingConfig:
     output_dir: Path
     streamer_name: str
     template_style: str = "twitch_purple"
+    _html_dir: Path = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate publishing configuration."""
@@ -105,11 +107,14 @@ class PublishingConfig:
         
         if not self.streamer_name or not self.streamer_name.strip():
             raise ValueError("Streamer name cannot be empty")
+        
+        # Built once; daily pages only add their file name
+        object.__setattr__(self, '_html_dir', self.output_dir / "html")
     
     @property
     def html_dir(self) -> Path:
         """Get the HTML output directory."""
-        return self.output_dir / "html"
+        return self._html_dir
     
     @property
     def index_file_path(self) -> Path:
@@ -118,8 +123,7 @@ class PublishingConfig:
     
     def get_daily_file_path(self, date: date) -> Path:
         """Get the path for a daily HTML file."""
-        date_str = date.isoformat()
-        return self.html_dir / f"songs_{date_str}.html"
+        return self._html_dir / f"songs_{date.isoformat()}.html"
     
     @property
     def display_streamer_name(self) -> str:
@@ -4,12 +4,13 @@ Core business logic for song requests, queue management,
 and streamer-related operations.
 """
 
-from .entities import SongRequest, StreamerId
+from .entities import SongRequest, StreamerId, frozen_now
 from .services import SongMatchingService, QueueRepository
 
 __all__ = [
     'SongRequest',
     'StreamerId', 
+    'frozen_now',
     'SongMatchingService',
     'QueueRepository'
 ]
\ No newline at end of file
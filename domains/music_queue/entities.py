@@ -3,9 +3,51 @@
 Core business entities representing song requests and streamer identity.
 """
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Iterator, Optional
+
+
+# Clock reading shared by everything created inside a frozen_now() block
+_FROZEN_NOW = ContextVar('frozen_now', default=None)
+
+
+@contextmanager
+def frozen_now() -> Iterator[datetime]:
+    """Use a single datetime.now() reading for SongRequest defaults in this block.
+    
+    Deserializing a batch of songs otherwise reads the clock once per
+    missing timestamp and once per missing scraped_at.
+    """
+    now = datetime.now()
+    token = _FROZEN_NOW.set(now)
+    try:
+        yield now
+    finally:
+        _FROZEN_NOW.reset(token)
+
+
+def _now() -> datetime:
+    """Get the current time, or the frozen time inside a frozen_now() block."""
+    frozen = _FROZEN_NOW.get()
+    return frozen if frozen is not None else datetime.now()
+
+
+def _now_scraped_at() -> str:
+    """Format the current time as "%Y-%m-%d %H:%M:%S" without going through strftime."""
+    now = _now()
+    return "%04d-%02d-%02d %02d:%02d:%02d" % (
+        now.year, now.month, now.day, now.hour, now.minute, now.second
+    )
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO timestamp, caching results since stored batches repeat them."""
+    return datetime.fromisoformat(timestamp)
 
 
 @dataclass
@@ -17,8 +59,8 @@ class SongRequest:
     requester: Optional[str] = None
     status: Optional[str] = None
     youtube_url: Optional[str] = None
-    timestamp: datetime = field(default_factory=datetime.now)
-    scraped_at: str = field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    timestamp: datetime = field(default_factory=_now)
+    scraped_at: str = field(default_factory=_now_scraped_at)
     selector_used: Optional[str] = None
     element_index: Optional[int] = None
     
@@ -29,6 +71,21 @@ class SongRequest:
         
         # Clean the title
         self.title = self.title.strip()
+        # Lowercased title and the title it was computed from, see title_ci
+        self._title_ci: Optional[str] = None
+        self._title_ci_source: Optional[str] = None
+    
+    @property
+    def title_ci(self) -> str:
+        """Get the lowercased title used for case-insensitive duplicate checks.
+        
+        Computed on first use and reused until title is reassigned.
+        """
+        title = self.title
+        if self._title_ci_source is not title:
+            self._title_ci = title.lower()
+            self._title_ci_source = title
+        return self._title_ci
     
     @property
     def has_youtube_link(self) -> bool:
@@ -69,9 +126,13 @@ class SongRequest:
         # Handle timestamp conversion
         timestamp = data.get('timestamp')
         if isinstance(timestamp, str):
-            timestamp = datetime.fromisoformat(timestamp)
+            timestamp = _parse_iso(timestamp)
         elif timestamp is None:
-            timestamp = datetime.now()
+            timestamp = _now()
+        
+        scraped_at = data.get('scraped_at')
+        if scraped_at is None:
+            scraped_at = _now_scraped_at()
         
         return cls(
             title=data.get('title', ''),
@@ -80,7 +141,7 @@ class SongRequest:
             status=data.get('status'),
             youtube_url=data.get('youtube_url'),
             timestamp=timestamp,
-            scraped_at=data.get('scraped_at', datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+            scraped_at=scraped_at,
             selector_used=data.get('selector_used'),
             element_index=data.get('element_index')
         )
@@ -4,13 +4,209 @@ Business logic services for song matching, queue management,
 and data repository operations.
 """
 
+import atexit
+import queue
 import re
-from datetime import date
+import string
+import threading
+import weakref
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Set
+from typing import List, Dict, FrozenSet, Iterable, Optional, Set, Tuple, Union
 from infrastructure.filesystem import FileSystemManager, FileOperationError
 from infrastructure.logging import UnicodeLogger
-from .entities import SongRequest, StreamerId
+from infrastructure.regex import compile_alternation
+from .entities import SongRequest, StreamerId, frozen_now
+
+
+# UI text detection patterns, compiled once instead of on every is_ui_text() call
+_UI_INDICATORS = (
+    "click", "button", "menu", "login", "sign", "register",
+    "home", "about", "contact", "help", "settings", "profile",
+    "search", "filter", "sort", "view", "show", "hide",
+    "next", "previous", "back", "forward", "submit", "cancel",
+    "song requests", "moobot", "refresh", "queue", "loading", "error",
+    "song queue", "song history", "requested by", "played", "ago",
+    "by ", "duration:", "status:", "page ", "page"
+)
+_UI_SUBSTR_RE = compile_alternation(_UI_INDICATORS)
+_PAGE_NUM_RE = re.compile(r'^page\s*\d+$')
+_NUM_RE = re.compile(r'^\d+$')
+_TIME_RE = re.compile(r'^\d{1,2}:\d{2}$')
+_META_RE = re.compile(r'^(by|requested by|played)\s+\w+.*\d+\s+(hour|minute|second)s?\s+ago$')
+_LETTER_RE = re.compile(r'[a-zA-Z]')
+_SEARCH_UI = frozenset({'search youtube', 'youtube search', 'search', 'youtube'})
+_SINGLE_WORD_UI = frozenset({"refresh", "loading", "error", "menu", "home", "back"})
+
+_TITLE_PREFIXES = ("Now Playing:", "Current:", "Playing:", "♪", "♫", "🎵", "🎶")
+_TITLE_SUFFIXES = (
+    ' (official video)', ' (official audio)', ' (official)',
+    ' (lyrics)', ' m/v', ' | lyrics'
+)
+
+
+class _NormalizeTable(dict):
+    """str.translate() table that keeps [a-z0-9] and maps everything else to a space."""
+    
+    def __missing__(self, codepoint: int) -> str:
+        self[codepoint] = ' '
+        return ' '
+
+
+_NORMALIZE_TABLE = _NormalizeTable(
+    (ord(char), char) for char in string.ascii_lowercase + string.digits
+)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_title(title: str) -> str:
+    """Normalize a song title for comparison.
+    
+    Cached because the same titles are compared pairwise many times
+    during duplicate detection.
+    """
+    if not title:
+        return ""
+    
+    # Convert to lowercase
+    title = title.lower().strip()
+    
+    # Remove common suffixes and prefixes
+    if title.endswith(_TITLE_SUFFIXES):
+        for suffix in _TITLE_SUFFIXES:
+            if title.endswith(suffix):
+                title = title[:-len(suffix)].strip()
+                break
+    
+    # Remove extra whitespace and special characters
+    title = title.translate(_NORMALIZE_TABLE)
+    return ' '.join(title.split())
+
+
+@lru_cache(maxsize=4096)
+def _title_features(title: str) -> Tuple[str, FrozenSet[str]]:
+    """Return a title's normalized form together with its word set."""
+    norm = _normalize_title(title)
+    return norm, frozenset(norm.split())
+
+
+@lru_cache(maxsize=4096)
+def _dedup_key(title: str) -> Tuple[str, str]:
+    """Get the key under which two titles count as the same song.
+    
+    Pairs the normalized title with the non-ASCII letters and digits that
+    normalization drops, so titles that differ only in those, like
+    "YOASOBI - 夜に駆ける" and "YOASOBI - アイドル", keep distinct keys.
+    """
+    non_ascii = ''.join(
+        char for char in title.casefold() if not char.isascii() and char.isalnum()
+    )
+    return _normalize_title(title), non_ascii
+
+
+def _features_match(
+    features1: Tuple[str, FrozenSet[str]],
+    features2: Tuple[str, FrozenSet[str]]
+) -> bool:
+    """Check if two titles, given as _title_features(), likely refer to the same song."""
+    norm1, words1 = features1
+    norm2, words2 = features2
+    
+    # Exact match
+    if norm1 == norm2:
+        return True
+    
+    # Check if one is contained in the other (for cases like \"Song\" vs \"Song (Official Video)\")
+    if norm1 in norm2 or norm2 in norm1:
+        # Make sure it's not too short to avoid false positives
+        if len(min(norm1, norm2)) > 10:
+            return True
+    
+    # Check similarity by word overlap
+    if len(words1) > 0 and len(words2) > 0:
+        overlap = len(words1 & words2)
+        
+        # Similarity can't exceed 70% unless the overlap covers
+        # more than 70% of the smaller title
+        if overlap <= 0.7 * min(len(words1), len(words2)):
+            return False
+        
+        total_words = len(words1) + len(words2) - overlap
+        similarity = overlap / total_words
+        
+        # If more than 70% of words match, consider it the same song
+        if similarity > 0.7:
+            return True
+    
+    return False
+
+
+@lru_cache(maxsize=4096)
+def _clean_song_title(title: str) -> str:
+    """Clean and normalize a song title for display.
+    
+    Cached because the same raw titles come back on every scrape of the page.
+    """
+    if not title:
+        return ""
+    
+    # Remove extra whitespace
+    title = " ".join(title.split())
+    
+    # Remove common prefixes/suffixes
+    for prefix in _TITLE_PREFIXES:
+        if title.startswith(prefix):
+            title = title[len(prefix):].strip()
+    
+    return title
+
+
+@lru_cache(maxsize=4096)
+def _is_ui_text(text: str) -> bool:
+    """Check if text looks like UI elements rather than song titles.
+    
+    Cached because the same page chrome is checked on every scrape.
+    """
+    if not text or len(text) > 100:
+        return True
+        
+    text_lower = text.lower().strip()
+    
+    # Check for UI patterns
+    if _UI_SUBSTR_RE.search(text_lower):
+        return True
+    
+    # Check for pagination patterns (page 1, page 2, etc.)
+    if _PAGE_NUM_RE.match(text_lower):
+        return True
+    
+    # Check for navigation patterns ("1", "2", "3" when they're just numbers)
+    if len(text_lower) <= 3 and _NUM_RE.match(text_lower):
+        return True
+    
+    # Check for search-related UI text
+    if text_lower in _SEARCH_UI:
+        return True
+    
+    # Check for time patterns (like "04:17", "03:41")
+    text_stripped = text.strip()
+    if _TIME_RE.match(text_stripped):
+        return True
+    
+    # Check for metadata patterns (like "By username X hours ago")
+    if _META_RE.match(text_lower):
+        return True
+        
+    # Check if it's mostly numbers or very short
+    if len(text_stripped) < 5 and not _LETTER_RE.search(text):
+        return True
+    
+    # Check for common single words that aren't songs
+    if text_lower in _SINGLE_WORD_UI:
+        return True
+        
+    return False
 
 
 class SongMatchingService:
@@ -23,36 +219,26 @@ class SongMatchingService:
         """Check if two song requests likely refer to the same song."""
         return self.titles_match(song1.title, song2.title)
     
+    def match_any(self, song: SongRequest, candidates: Iterable[SongRequest]) -> bool:
+        """Check if a song request likely matches any of the candidates.
+        
+        The song's title is normalized once for the whole batch rather than
+        once per comparison.
+        """
+        try:
+            features = _title_features(song.title)
+            return any(
+                _features_match(features, _title_features(candidate.title))
+                for candidate in candidates
+            )
+        except Exception:
+            # On any error, assume they don't match
+            return False
+    
     def titles_match(self, title1: str, title2: str) -> bool:
         """Check if two song titles likely refer to the same song."""
         try:
-            norm1 = self.normalize_title(title1)
-            norm2 = self.normalize_title(title2)
-            
-            # Exact match
-            if norm1 == norm2:
-                return True
-            
-            # Check if one is contained in the other (for cases like \"Song\" vs \"Song (Official Video)\")
-            if norm1 in norm2 or norm2 in norm1:
-                # Make sure it's not too short to avoid false positives
-                if len(min(norm1, norm2)) > 10:
-                    return True
-            
-            # Check similarity by word overlap
-            words1 = set(norm1.split())
-            words2 = set(norm2.split())
-            
-            if len(words1) > 0 and len(words2) > 0:
-                overlap = len(words1.intersection(words2))
-                total_words = len(words1.union(words2))
-                similarity = overlap / total_words
-                
-                # If more than 70% of words match, consider it the same song
-                if similarity > 0.7:
-                    return True
-            
-            return False
+            return _features_match(_title_features(title1), _title_features(title2))
             
         except Exception:
             # On any error, assume they don't match
@@ -60,98 +246,65 @@ class SongMatchingService:
     
     def normalize_title(self, title: str) -> str:
         """Normalize a song title for comparison."""
-        if not title:
-            return ""
-        
-        # Convert to lowercase
-        title = title.lower().strip()
-        
-        # Remove common suffixes and prefixes
-        suffixes = [
-            ' (official video)', ' (official audio)', ' (official)', 
-            ' (lyrics)', ' m/v', ' | lyrics'
-        ]
-        for suffix in suffixes:
-            if title.endswith(suffix):
-                title = title[:-len(suffix)].strip()
-                break
-        
-        # Remove extra whitespace and special characters
-        title = re.sub(r'[^a-z0-9\\s]', ' ', title)
-        title = ' '.join(title.split())
-        return title
+        return _normalize_title(title)
+    
+    def dedup_key(self, title: str) -> Tuple[str, str]:
+        """Get a key that is equal for titles differing only in case, punctuation or suffix."""
+        return _dedup_key(title)
     
     def clean_song_title(self, title: str) -> str:
         """Clean and normalize song titles for display."""
-        if not title:
-            return ""
-        
-        # Remove extra whitespace
-        title = " ".join(title.split())
-        
-        # Remove common prefixes/suffixes
-        prefixes_to_remove = ["Now Playing:", "Current:", "Playing:", "♪", "♫", "🎵", "🎶"]
-        for prefix in prefixes_to_remove:
-            if title.startswith(prefix):
-                title = title[len(prefix):].strip()
-        
-        return title
+        return _clean_song_title(title)
     
     def is_ui_text(self, text: str) -> bool:
         """Check if text looks like UI elements rather than song titles."""
-        if not text or len(text) > 100:
-            return True
-            
-        text_lower = text.lower().strip()
-        
-        # Common UI text patterns
-        ui_indicators = [
-            "click", "button", "menu", "login", "sign", "register",
-            "home", "about", "contact", "help", "settings", "profile",
-            "search", "filter", "sort", "view", "show", "hide",
-            "next", "previous", "back", "forward", "submit", "cancel",
-            "song requests", "moobot", "refresh", "queue", "loading", "error",
-            "song queue", "song history", "requested by", "played", "ago",
-            "by ", "duration:", "status:", "page ", "page"
-        ]
-        
-        # Check for UI patterns
-        if any(indicator in text_lower for indicator in ui_indicators):
-            return True
-        
-        # Check for pagination patterns (page 1, page 2, etc.)
-        if re.match(r'^page\s*\d+$', text_lower):
-            return True
-        
-        # Check for navigation patterns ("1", "2", "3" when they're just numbers)
-        if re.match(r'^\d+$', text_lower) and len(text_lower) <= 3:
-            return True
-        
-        # Check for search-related UI text
-        search_ui_patterns = [
-            'search youtube', 'youtube search', 'search', 'youtube'
-        ]
-        if text_lower in search_ui_patterns:
-            return True
-        
-        # Check for time patterns (like "04:17", "03:41")
-        if re.match(r'^\d{1,2}:\d{2}$', text.strip()):
-            return True
-        
-        # Check for metadata patterns (like "By username X hours ago")
-        if re.match(r'^(by|requested by|played)\s+\w+.*\d+\s+(hour|minute|second)s?\s+ago$', text_lower):
-            return True
-            
-        # Check if it's mostly numbers or very short
-        if len(text.strip()) < 5 and not re.search(r'[a-zA-Z]', text):
-            return True
-        
-        # Check for common single words that aren't songs
-        single_word_ui = ["refresh", "loading", "error", "menu", "home", "back"]
-        if text_lower in single_word_ui:
-            return True
-            
-        return False
+        return _is_ui_text(text)
+
+
+# Queued after the last snapshot to make a repository's writer thread exit
+_STOP_WRITER = object()
+
+# Every live repository, closed at interpreter exit so unflushed changes are written
+_open_repositories: "weakref.WeakSet[QueueRepository]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_repositories() -> None:
+    """Write the pending changes of repositories that are still open."""
+    for repository in list(_open_repositories):
+        repository.close()
+
+
+def _write_snapshots(
+    pending_writes: queue.Queue,
+    fs_manager: FileSystemManager,
+    data_file: Path,
+    logger: UnicodeLogger,
+    repository_ref: "weakref.ReferenceType[QueueRepository]"
+) -> None:
+    """Write queued snapshots to storage, one at a time, until told to stop.
+    
+    Only a weak reference to the repository is held, so a repository that
+    is dropped without close() can still be collected; its finalizer then
+    queues the stop marker.
+    """
+    while True:
+        snapshot = pending_writes.get()
+        try:
+            if snapshot is _STOP_WRITER:
+                return
+            fs_manager.save_json_data(snapshot, data_file)
+            total = sum(len(songs) for songs in snapshot.values())
+            logger.info(f"Saved {total} songs across {len(snapshot)} dates")
+        except FileOperationError as e:
+            logger.error(f"Failed to save songs data: {e}")
+            # Keep the changes pending so the next flush() retries them
+            repository = repository_ref()
+            if repository is not None:
+                with repository._pending_lock:
+                    repository._dirty = True
+        finally:
+            pending_writes.task_done()
 
 
 class QueueRepository:
@@ -162,6 +315,18 @@ class QueueRepository:
         self.logger = logger
         self.fs_manager = FileSystemManager(data_file.parent)
         self._songs_data = self._load_data()
+        # Lowercased titles per date, built lazily for duplicate checks
+        self._title_index: Dict[str, Set[str]] = {}
+        # Set when in-memory data has changes that are not yet written
+        self._dirty: bool = False
+        # Holds at most one snapshot waiting to be written; newer snapshots
+        # replace an older one that the writer hasn't picked up yet
+        self._pending_writes: queue.Queue = queue.Queue(maxsize=1)
+        self._pending_lock = threading.Lock()
+        # Started by the first flush() that has something to write
+        self._writer: Optional[threading.Thread] = None
+        self._stop_writer: Optional[weakref.finalize] = None
+        _open_repositories.add(self)
     
     def _load_data(self) -> Dict[str, List[Dict]]:
         """Load existing songs data from storage."""
@@ -171,19 +336,138 @@ class QueueRepository:
             self.logger.warning(f"Could not load existing data: {e}")
             return {}
     
-    def save_daily_queue(self, queue_date: date, songs: List[SongRequest]) -> None:
-        """Save songs for a specific date."""
+    def save_daily_queue(
+        self,
+        queue_date: date,
+        songs: List[Union[SongRequest, Dict]],
+        immediate: bool = False
+    ) -> None:
+        """Save songs for a specific date.
+        
+        Songs may be SongRequest objects or dictionaries already in storage
+        format. Changes are kept in memory until flush() is called, unless
+        immediate is True.
+        
+        Raises:
+            ValueError: If a song dictionary is not in storage format
+        """
         date_str = queue_date.isoformat()
         
         # Convert SongRequest objects to dictionaries for storage
-        song_dicts = [song.to_dict() for song in songs]
+        song_dicts = [self._to_song_dict(song) for song in songs]
         self._songs_data[date_str] = song_dicts
+        self._title_index.pop(date_str, None)
+        self._dirty = True
         
-        try:
-            self.fs_manager.save_json_data(self._songs_data, self.data_file)
-            self.logger.info(f"Saved {len(songs)} songs for {date_str}")
-        except FileOperationError as e:
-            self.logger.error(f"Failed to save songs data: {e}")
+        if immediate:
+            self.flush(wait=True)
+    
+    def flush(self, wait: bool = False) -> None:
+        """Write pending changes to storage, if there are any.
+        
+        The write happens on a background thread so scraping can carry on
+        while the file is saved. Pass wait=True to block until it is done.
+        """
+        with self._pending_lock:
+            if self._dirty:
+                snapshot = {
+                    date_str: list(songs) for date_str, songs in self._songs_data.items()
+                }
+                self._dirty = False
+                
+                # Drop an older snapshot that hasn't been written yet
+                try:
+                    self._pending_writes.get_nowait()
+                    self._pending_writes.task_done()
+                except queue.Empty:
+                    pass
+                self._pending_writes.put_nowait(snapshot)
+                self._start_writer()
+        
+        if wait:
+            self._pending_writes.join()
+    
+    def close(self) -> None:
+        """Write pending changes and stop the background writer.
+        
+        The repository stays usable; a later flush() starts a new writer.
+        """
+        self.flush(wait=True)
+        
+        with self._pending_lock:
+            writer, self._writer = self._writer, None
+            stop_writer, self._stop_writer = self._stop_writer, None
+        
+        if writer is not None:
+            # Queue the stop marker directly: finalizers no longer run once
+            # interpreter shutdown has begun
+            stop_writer.detach()
+            self._pending_writes.put(_STOP_WRITER)
+            writer.join()
+    
+    def _start_writer(self) -> None:
+        """Start the background writer if it isn't running. Call with _pending_lock held."""
+        if self._writer is not None:
+            return
+        
+        self._writer = threading.Thread(
+            target=_write_snapshots,
+            args=(
+                self._pending_writes, self.fs_manager, self.data_file,
+                self.logger, weakref.ref(self)
+            ),
+            daemon=True
+        )
+        self._writer.start()
+        
+        # Stop the writer if the repository is dropped without close(). At
+        # exit, _close_open_repositories flushes and stops it instead.
+        self._stop_writer = weakref.finalize(
+            self, self._pending_writes.put, _STOP_WRITER
+        )
+        self._stop_writer.atexit = False
+    
+    @staticmethod
+    def _to_song_dict(song: Union[SongRequest, Dict]) -> Dict:
+        """Get the storage dictionary for a song, checking dictionaries first."""
+        if isinstance(song, dict):
+            QueueRepository._check_song_dict(song)
+            return song
+        return song.to_dict()
+    
+    @staticmethod
+    def _check_song_dict(song: Dict) -> None:
+        """Check that a dictionary is a song in storage format.
+        
+        Raises:
+            ValueError: If the title is missing or empty, or the timestamp
+                is not an ISO string
+        """
+        title = song.get('title')
+        if not isinstance(title, str) or not title.strip():
+            raise ValueError(f"Song has no title: {song!r}")
+        
+        timestamp = song.get('timestamp')
+        if timestamp is not None:
+            try:
+                datetime.fromisoformat(timestamp)
+            except (TypeError, ValueError):
+                raise ValueError(f"Song timestamp is not an ISO string: {song!r}") from None
+    
+    @staticmethod
+    def _title_key(song: Union[SongRequest, Dict]) -> str:
+        """Get the lowercased title used for duplicate checks."""
+        if isinstance(song, dict):
+            return (song.get('title') or '').strip().lower()
+        return song.title_ci
+    
+    def _get_title_index(self, date_str: str) -> Set[str]:
+        """Get the set of lowercased titles stored for a date."""
+        titles = self._title_index.get(date_str)
+        if titles is None:
+            titles = {self._title_key(song_dict) for song_dict in self._songs_data.get(date_str, [])}
+            self._title_index[date_str] = titles
+        return titles
     
     def load_daily_queue(self, queue_date: date) -> List[SongRequest]:
         """Load songs for a specific date."""
@@ -194,7 +478,8 @@ class QueueRepository:
         
         # Convert dictionaries back to SongRequest objects
         song_dicts = self._songs_data[date_str]
-        return [SongRequest.from_dict(song_dict) for song_dict in song_dicts]
+        with frozen_now():
+            return [SongRequest.from_dict(song_dict) for song_dict in song_dicts]
     
     def get_all_dates(self) -> List[date]:
         """Get all dates that have song data."""
@@ -207,11 +492,12 @@ class QueueRepository:
                 continue
         return sorted(dates)
     
-    def add_new_songs(self, new_songs: List[SongRequest], queue_date: date = None) -> int:
+    def add_new_songs(self, new_songs: List[Union[SongRequest, Dict]], queue_date: date = None) -> int:
         """Add new songs to the queue, avoiding duplicates.
         
         Args:
-            new_songs: List of new songs to add
+            new_songs: List of new songs to add, as SongRequest objects or
+                dictionaries already in storage format
             queue_date: Date to add songs for (defaults to today)
             
         Returns:
@@ -220,21 +506,30 @@ class QueueRepository:
         if queue_date is None:
             queue_date = date.today()
         
-        # Load existing songs for this date
-        existing_songs = self.load_daily_queue(queue_date)
-        existing_titles = {song.title.lower() for song in existing_songs}
+        date_str = queue_date.isoformat()
+        existing_titles = self._get_title_index(date_str)
         
-        # Filter out duplicates
+        # Filter out invalid entries and duplicates
         songs_to_add = []
         for song in new_songs:
-            if song.title.lower() not in existing_titles:
+            if isinstance(song, dict):
+                try:
+                    self._check_song_dict(song)
+                except ValueError as e:
+                    self.logger.warning(f"Skipping invalid song: {e}")
+                    continue
+            
+            title_lower = self._title_key(song)
+            if title_lower not in existing_titles:
                 songs_to_add.append(song)
-                existing_titles.add(song.title.lower())
+                existing_titles.add(title_lower)
         
         if songs_to_add:
-            # Add to existing songs and save
-            all_songs = existing_songs + songs_to_add
-            self.save_daily_queue(queue_date, all_songs)
+            # Append to the stored songs in place; written on the next flush()
+            self._songs_data.setdefault(date_str, []).extend(
+                self._to_song_dict(song) for song in songs_to_add
+            )
+            self._dirty = True
             self.logger.info(f"Added {len(songs_to_add)} new songs for {queue_date}")
         
         return len(songs_to_add)
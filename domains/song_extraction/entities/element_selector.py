@@ -1,10 +1,15 @@
 """ElementSelector entity for defining web element selection."""
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from enum import Enum
 
 
+_YOUTUBE_SELECTOR_RE = re.compile(r'youtube|youtu\.be|href\*=', re.IGNORECASE)
+
+
 class SelectorType(Enum):
     """Types of CSS selectors for element selection."""
     CSS = "css"
@@ -14,12 +19,13 @@ class SelectorType(Enum):
     ID = "id"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ElementSelector:
     """Defines how to select web elements for song extraction.
     
     Encapsulates the selector string, type, and associated metadata
-    for finding elements on a web page.
+    for finding elements on a web page. Selectors are immutable, so the
+    standard ones built by the create_* factories are shared instances.
     """
     
     selector: str
@@ -27,33 +33,37 @@ class ElementSelector:
     description: Optional[str] = None
     priority: int = 1  # Higher numbers = higher priority
     is_fallback: bool = False
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Dict[str, Any] = field(default_factory=dict, hash=False)
     
     def __post_init__(self):
-        """Initialize optional fields."""
-        if self.metadata is None:
-            self.metadata = {}
+        """Classify the selector once; strategies check it on every dispatch."""
+        object.__setattr__(
+            self, '_is_table_row', "tr" in self.selector.lower()
+        )
+        object.__setattr__(
+            self, '_is_youtube_link', _YOUTUBE_SELECTOR_RE.search(self.selector) is not None
+        )
     
     @property
     def is_table_row_selector(self) -> bool:
         """Check if this selector targets table rows."""
-        return "tr" in self.selector.lower()
+        return self._is_table_row
     
     @property
     def is_youtube_link_selector(self) -> bool:
         """Check if this selector targets YouTube links."""
-        return any(keyword in self.selector.lower() 
-                  for keyword in ["youtube", "youtu.be", "href*="])
+        return self._is_youtube_link
     
     def get_metadata(self, key: str, default: Any = None) -> Any:
         """Get metadata value."""
         return self.metadata.get(key, default)
     
-    def set_metadata(self, key: str, value: Any):
-        """Set metadata value."""
-        self.metadata[key] = value
+    def set_metadata(self, key: str, value: Any) -> "ElementSelector":
+        """Return a copy of this selector with a metadata value set."""
+        return replace(self, metadata={**self.metadata, key: value})
     
     @classmethod
+    @lru_cache(maxsize=None)
     def create_table_row(cls, priority: int = 10) -> "ElementSelector":
         """Create selector for Moobot table rows."""
         return cls(
@@ -64,6 +74,7 @@ class ElementSelector:
         )
     
     @classmethod
+    @lru_cache(maxsize=None)
     def create_youtube_links(cls, priority: int = 8) -> "ElementSelector":
         """Create selector for YouTube links."""
         return cls(
@@ -74,6 +85,7 @@ class ElementSelector:
         )
     
     @classmethod
+    @lru_cache(maxsize=None)
     def create_song_titles(cls, priority: int = 5) -> "ElementSelector":
         """Create selector for song title elements."""
         return cls(
@@ -84,6 +96,7 @@ class ElementSelector:
         )
     
     @classmethod
+    @lru_cache(maxsize=None)
     def create_generic_links(cls, priority: int = 3) -> "ElementSelector":
         """Create selector for generic links."""
         return cls(
@@ -95,6 +108,7 @@ class ElementSelector:
         )
     
     @classmethod
+    @lru_cache(maxsize=None)
     def create_text_elements(cls, priority: int = 1) -> "ElementSelector":
         """Create selector for text elements (fallback)."""
         return cls(
@@ -1,6 +1,6 @@
 """ExtractionConfig entity for configuring song extraction."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
 
@@ -34,6 +34,8 @@ class ExtractionConfig:
     try_history_thumbnails: bool = True
     try_javascript_extraction: bool = True
     fallback_to_search: bool = True
+    new_window_timeout: float = 3.0  # Seconds to wait for a link button's tab to open
+    new_window_url_timeout: float = 2.0  # Seconds to wait for that tab to reach YouTube
     
     # Audio control (for YouTube extraction)
     mute_audio: bool = True
@@ -41,16 +43,11 @@ class ExtractionConfig:
     close_new_tabs: bool = True
     
     # Limits and performance
-    max_songs_per_strategy: Optional[int] = None
+    max_songs_per_strategy: Optional[int] = None  # None for no limit, 0 skips extraction
     timeout_seconds: float = 30.0
     
     # Custom attributes for specific strategies
-    custom_attributes: Dict[str, Any] = None
-    
-    def __post_init__(self):
-        """Initialize optional fields."""
-        if self.custom_attributes is None:
-            self.custom_attributes = {}
+    custom_attributes: Dict[str, Any] = field(default_factory=dict)
     
     def get_custom_attribute(self, key: str, default: Any = None) -> Any:
         """Get a custom attribute value."""
@@ -1,6 +1,6 @@
 """ExtractionResult entity for song extraction domain."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
@@ -22,15 +22,8 @@ class ExtractionResult:
     element_count: int
     success: bool = True
     error_message: Optional[str] = None
-    warnings: List[str] = None
-    metadata: Optional[Dict[str, Any]] = None
-    
-    def __post_init__(self):
-        """Initialize optional fields."""
-        if self.warnings is None:
-            self.warnings = []
-        if self.metadata is None:
-            self.metadata = {}
+    warnings: List[str] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
     
     @property
     def song_count(self) -> int:
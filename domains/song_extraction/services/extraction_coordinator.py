@@ -1,7 +1,9 @@
 """Extraction coordinator service that manages multiple extraction strategies."""
 
 import logging
-from typing import List, Dict, Optional, TYPE_CHECKING
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple, TYPE_CHECKING
 from collections import defaultdict
 
 from .extraction_strategy import ExtractionStrategy
@@ -11,6 +13,7 @@ from .youtube_link_extraction_strategy import YouTubeLinkExtractionStrategy
 from .text_parsing_extraction_strategy import TextParsingExtractionStrategy
 
 from ..entities import ExtractionResult, ExtractionConfig, ElementSelector
+from ..entities.element_selector import SelectorType
 from domains.music_queue.entities import SongRequest
 from domains.music_queue.services import SongMatchingService
 
@@ -18,6 +21,24 @@ if TYPE_CHECKING:
     from selenium.webdriver.remote.webdriver import WebDriver
 
 
+# Preference between strategies' results (table rows first, then YouTube links, etc.)
+STRATEGY_PRIORITY = MappingProxyType({
+    "table_row": 10,
+    "youtube_link": 8,
+    "general_element": 5,
+    "text_parsing": 1
+})
+
+# Selectors are immutable, so the default set is built once and shared
+_DEFAULT_SELECTORS: Tuple[ElementSelector, ...] = (
+    ElementSelector.create_table_row(priority=10),
+    ElementSelector.create_youtube_links(priority=8),
+    ElementSelector.create_song_titles(priority=5),
+    ElementSelector.create_generic_links(priority=3),
+    ElementSelector.create_text_elements(priority=1)
+)
+
+
 class ExtractionCoordinator:
     """Coordinates multiple extraction strategies to comprehensively extract songs.
     
@@ -34,8 +55,25 @@ class ExtractionCoordinator:
         self.logger = logger or logging.getLogger("extraction.coordinator")
         self.song_matcher = SongMatchingService()
         
-        # Initialize extraction strategies
-        self.strategies: List[ExtractionStrategy] = [
+        # Compatible strategies per selector, valid for _compatible_config only
+        self._compatible_cache: Dict[tuple, List[ExtractionStrategy]] = {}
+        self._compatible_config: Optional[ExtractionConfig] = None
+        
+        # Strategies are created on first use, see the strategies property
+        self._strategies: Optional[List[ExtractionStrategy]] = None
+        self._strategy_by_name: Dict[str, ExtractionStrategy] = {}
+        self._strategies_by_type: Dict[SelectorType, List[ExtractionStrategy]] = {}
+    
+    @property
+    def strategies(self) -> List[ExtractionStrategy]:
+        """Extraction strategies, highest priority first."""
+        if self._strategies is None:
+            self._create_strategies()
+        return self._strategies
+    
+    def _create_strategies(self) -> None:
+        """Create the extraction strategies and the lookups built from them."""
+        strategies: List[ExtractionStrategy] = [
             TableRowExtractionStrategy(),
             YouTubeLinkExtractionStrategy(), 
             GeneralElementExtractionStrategy(),
@@ -43,9 +81,20 @@ class ExtractionCoordinator:
         ]
         
         # Sort strategies by priority (highest first)
-        self.strategies.sort(key=lambda s: s.get_priority(), reverse=True)
+        strategies.sort(key=lambda s: s.get_priority(), reverse=True)
+        self._strategy_by_name = {strategy.name: strategy for strategy in strategies}
+        # Strategies that can run each selector type, still in priority order
+        self._strategies_by_type = {
+            selector_type: [
+                strategy for strategy in strategies
+                if not strategy.SUPPORTED_SELECTOR_TYPES
+                or selector_type in strategy.SUPPORTED_SELECTOR_TYPES
+            ]
+            for selector_type in SelectorType
+        }
+        self._strategies = strategies
         
-        self.logger.info(f"Initialized {len(self.strategies)} extraction strategies")
+        self.logger.info(f"Initialized {len(strategies)} extraction strategies")
     
     def extract_songs_comprehensive(
         self,
@@ -63,19 +112,23 @@ class ExtractionCoordinator:
         Returns:
             List of ExtractionResult objects from each strategy/selector combination
         """
-        all_results = []
-        
+        with self._shared_element_lookups(config):
+            return list(self._iter_comprehensive(driver, selectors, config))
+    
+    def _iter_comprehensive(
+        self,
+        driver: "WebDriver",
+        selectors: List[ElementSelector],
+        config: ExtractionConfig
+    ) -> Iterator[ExtractionResult]:
+        """Yield the result of each strategy/selector combination as it completes, in order."""
         # Sort selectors by priority (highest first)
-        sorted_selectors = sorted(selectors, key=lambda s: s.priority, reverse=True)
+        sorted_selectors = self._maybe_sort_selectors(selectors)
         
         for selector in sorted_selectors:
             self.logger.debug(f"Processing selector: {selector.selector}")
             
-            # Find strategies that can handle this selector
-            compatible_strategies = [
-                strategy for strategy in self.strategies
-                if strategy.can_handle(selector) and strategy.validate_config(config)
-            ]
+            compatible_strategies = self._get_compatible_strategies(selector, config)
             
             if not compatible_strategies:
                 self.logger.warning(f"No strategies can handle selector: {selector.selector}")
@@ -83,26 +136,85 @@ class ExtractionCoordinator:
             
             # Execute each compatible strategy
             for strategy in compatible_strategies:
-                try:
-                    result = strategy.extract_songs(driver, selector, config)
-                    all_results.append(result)
-                    
-                    self.logger.info(
-                        f"{strategy.name} found {result.song_count} songs "
-                        f"with selector '{selector.selector}'"
-                    )
-                    
-                except Exception as e:
-                    self.logger.error(f"Strategy {strategy.name} failed: {e}")
-                    # Create failure result for tracking
-                    failure_result = ExtractionResult.create_failure(
-                        error_message=str(e),
-                        strategy_used=strategy.name,
-                        selector_used=selector.selector
-                    )
-                    all_results.append(failure_result)
-        
-        return all_results
+                yield self._run_strategy(strategy, driver, selector, config)
+    
+    @contextmanager
+    def _shared_element_lookups(self, config: ExtractionConfig) -> Iterator[None]:
+        """Let strategies share element lookups through config for one extraction."""
+        if config.get_custom_attribute("element_cache") is not None:
+            # Already inside an extraction that set up the cache
+            yield
+            return
+        
+        # Entries must not outlive this extraction, since the page may change
+        config.set_custom_attribute("element_cache", {})
+        try:
+            yield
+        finally:
+            config.set_custom_attribute("element_cache", None)
+    
+    @staticmethod
+    def _maybe_sort_selectors(selectors: List[ElementSelector]) -> List[ElementSelector]:
+        """Order selectors by priority (highest first), skipping the sort if they already are."""
+        if all(
+            selectors[i].priority >= selectors[i + 1].priority
+            for i in range(len(selectors) - 1)
+        ):
+            return selectors
+        return sorted(selectors, key=lambda s: s.priority, reverse=True)
+    
+    def _get_compatible_strategies(
+        self,
+        selector: ElementSelector,
+        config: ExtractionConfig
+    ) -> List[ExtractionStrategy]:
+        """Get the strategies that can handle a selector under a config.
+        
+        can_handle() and validate_config() only look at the selector's own
+        fields and the config, so results are cached until a different
+        config object is passed in.
+        """
+        if config is not self._compatible_config:
+            self._compatible_cache.clear()
+            self._compatible_config = config
+        
+        key = (selector.selector, selector.selector_type, selector.is_fallback, selector.priority)
+        compatible_strategies = self._compatible_cache.get(key)
+        if compatible_strategies is None:
+            if self._strategies is None:
+                self._create_strategies()
+            compatible_strategies = [
+                strategy for strategy in self._strategies_by_type[selector.selector_type]
+                if strategy.can_handle(selector) and strategy.validate_config(config)
+            ]
+            self._compatible_cache[key] = compatible_strategies
+        return compatible_strategies
+    
+    def _run_strategy(
+        self,
+        strategy: ExtractionStrategy,
+        driver: "WebDriver",
+        selector: ElementSelector,
+        config: ExtractionConfig
+    ) -> ExtractionResult:
+        """Run one strategy against one selector, turning errors into a failure result."""
+        try:
+            result = strategy.extract_songs(driver, selector, config)
+            
+            self.logger.info(
+                f"{strategy.name} found {result.song_count} songs "
+                f"with selector '{selector.selector}'"
+            )
+            return result
+            
+        except Exception as e:
+            self.logger.error(f"Strategy {strategy.name} failed: {e}")
+            # Create failure result for tracking
+            return ExtractionResult.create_failure(
+                error_message=str(e),
+                strategy_used=strategy.name,
+                selector_used=selector.selector
+            )
     
     def extract_songs_deduplicated(
         self,
@@ -120,16 +232,34 @@ class ExtractionCoordinator:
         Returns:
             Single ExtractionResult with deduplicated songs from all strategies
         """
-        # Get all results
-        all_results = self.extract_songs_comprehensive(driver, selectors, config)
+        successful_results = []
+        total_results = 0
+        total_elements = 0
+        strategies_used = set()
+        selectors_used = set()
+        warnings = []
+        
+        # Gather everything the summary needs in one pass over the results;
+        # failed results aren't kept once they've been counted
+        with self._shared_element_lookups(config):
+            for individual_result in self._iter_comprehensive(driver, selectors, config):
+                total_results += 1
+                total_elements += individual_result.element_count
+                strategies_used.add(individual_result.strategy_used)
+                selectors_used.add(individual_result.selector_used)
+                warnings.extend(
+                    f"{individual_result.strategy_used}: {warning}"
+                    for warning in individual_result.warnings
+                )
+                if individual_result.success:
+                    successful_results.append(individual_result)
         
         # Combine and deduplicate songs
-        combined_songs = self._combine_and_deduplicate_songs(all_results)
+        combined_songs = self._combine_and_deduplicate_songs(successful_results)
         
         # Create summary result
-        total_elements = sum(result.element_count for result in all_results)
-        strategies_used = list(set(result.strategy_used for result in all_results))
-        selectors_used = list(set(result.selector_used for result in all_results))
+        strategies_used = sorted(strategies_used)
+        selectors_used = sorted(selectors_used)
         
         result = ExtractionResult.create_success(
             songs=combined_songs,
@@ -139,21 +269,19 @@ class ExtractionCoordinator:
         )
         
         # Add metadata about the coordination process
-        result.add_metadata("total_results", len(all_results))
-        result.add_metadata("successful_results", len([r for r in all_results if r.success]))
-        result.add_metadata("failed_results", len([r for r in all_results if not r.success]))
+        result.add_metadata("total_results", total_results)
+        result.add_metadata("successful_results", len(successful_results))
+        result.add_metadata("failed_results", total_results - len(successful_results))
         result.add_metadata("strategies_used", strategies_used)
         result.add_metadata("selectors_used", selectors_used)
         result.add_metadata("deduplication_enabled", True)
         
         # Collect warnings from all results
-        for individual_result in all_results:
-            for warning in individual_result.warnings:
-                result.add_warning(f"{individual_result.strategy_used}: {warning}")
+        result.warnings.extend(warnings)
         
         self.logger.info(
             f"Coordinator extracted {len(combined_songs)} unique songs "
-            f"from {len(all_results)} strategy executions"
+            f"from {total_results} strategy executions"
         )
         
         return result
@@ -188,20 +316,21 @@ class ExtractionCoordinator:
         # Use the standard deduplicated extraction but with optimization context
         result = self.extract_songs_deduplicated(driver, selectors, config)
         
-        # Count how many URLs were reused vs newly extracted
-        urls_reused = 0
-        urls_extracted = 0
-        
-        for song in result.songs:
-            if song.youtube_url:
-                title_lower = song.title.lower()
-                if title_lower in existing_songs_with_urls and song.youtube_url == existing_songs_with_urls[title_lower]:
-                    urls_reused += 1
-                else:
-                    urls_extracted += 1
-        
-        if urls_reused > 0:
-            self.logger.info(f"Optimization results: {urls_reused} URLs reused, {urls_extracted} URLs newly extracted")
+        # Count how many URLs were reused vs newly extracted; only needed for
+        # the log message, so skip it when nothing could be reused or logged
+        if existing_songs_with_urls and self.logger.isEnabledFor(logging.INFO):
+            urls_reused = 0
+            urls_extracted = 0
+            
+            for song in result.songs:
+                if song.youtube_url:
+                    if song.youtube_url == existing_songs_with_urls.get(song.title_ci):
+                        urls_reused += 1
+                    else:
+                        urls_extracted += 1
+            
+            if urls_reused > 0:
+                self.logger.info(f"Optimization results: {urls_reused} URLs reused, {urls_extracted} URLs newly extracted")
         
         return result
     
@@ -228,39 +357,33 @@ class ExtractionCoordinator:
         min_songs = config.get_custom_attribute("min_songs_for_success", 1)
         
         # Sort selectors by priority (highest first)
-        sorted_selectors = sorted(selectors, key=lambda s: s.priority, reverse=True)
+        sorted_selectors = self._maybe_sort_selectors(selectors)
         
-        for selector in sorted_selectors:
-            # Find strategies that can handle this selector
-            compatible_strategies = [
-                strategy for strategy in self.strategies
-                if strategy.can_handle(selector) and strategy.validate_config(config)
-            ]
-            
-            for strategy in compatible_strategies:
-                try:
-                    result = strategy.extract_songs(driver, selector, config)
-                    
-                    # Update best result if this one is better
-                    if self._is_better_result(result, best_result):
-                        best_result = result
+        with self._shared_element_lookups(config):
+            for selector in sorted_selectors:
+                compatible_strategies = self._get_compatible_strategies(selector, config)
+                
+                for strategy in compatible_strategies:
+                    try:
+                        result = strategy.extract_songs(driver, selector, config)
                         
-                        self.logger.info(
-                            f"New best result: {strategy.name} found {result.song_count} songs"
-                        )
-                    
-                    # Stop if we have enough songs
-                    if result.success and result.song_count >= min_songs:
-                        self.logger.info(f"Sufficient songs found, stopping search")
-                        break
+                        # Update best result if this one is better
+                        if self._is_better_result(result, best_result):
+                            best_result = result
+                            
+                            self.logger.info(
+                                f"New best result: {strategy.name} found {result.song_count} songs"
+                            )
                         
-                except Exception as e:
-                    self.logger.error(f"Strategy {strategy.name} failed: {e}")
-                    continue
-            
-            # Stop if we have a good result
-            if best_result and best_result.success and best_result.song_count >= min_songs:
-                break
+                        # Stop as soon as we have enough songs; no need to finish
+                        # this selector or try the remaining ones
+                        if result.success and result.song_count >= min_songs:
+                            self.logger.info(f"Sufficient songs found, stopping search")
+                            return best_result
+                            
+                    except Exception as e:
+                        self.logger.error(f"Strategy {strategy.name} failed: {e}")
+                        continue
         
         # Return best result or create failure if nothing worked
         if best_result is None:
@@ -272,7 +395,7 @@ class ExtractionCoordinator:
         
         return best_result
     
-    def _combine_and_deduplicate_songs(self, results: List[ExtractionResult]) -> List[SongRequest]:
+    def _combine_and_deduplicate_songs(self, results: Iterable[ExtractionResult]) -> List[SongRequest]:
         """Combine songs from multiple results and remove duplicates.
         
         Args:
@@ -282,35 +405,36 @@ class ExtractionCoordinator:
             List of unique SongRequest objects
         """
         all_songs = []
+        # Normalized titles of accepted songs; an exact hit is always a duplicate
         seen_titles = set()
         
-        # Collect all successful results
-        successful_results = [result for result in results if result.success]
-        
-        # Sort by strategy priority (table rows first, then YouTube links, etc.)
-        strategy_priority = {
-            "table_row": 10,
-            "youtube_link": 8,
-            "general_element": 5,
-            "text_parsing": 1
-        }
-        
-        successful_results.sort(
-            key=lambda r: strategy_priority.get(r.strategy_used, 0),
-            reverse=True
-        )
+        # Group successful results by strategy priority, keeping their order
+        results_by_priority: Dict[int, List[ExtractionResult]] = defaultdict(list)
+        for result in results:
+            if result.success:
+                results_by_priority[STRATEGY_PRIORITY.get(result.strategy_used, 0)].append(result)
+        
+        # Order by strategy priority (table rows first, then YouTube links, etc.)
+        successful_results = [
+            result
+            for priority in sorted(results_by_priority, reverse=True)
+            for result in results_by_priority[priority]
+        ]
         
         for result in successful_results:
             for song in result.songs:
-                # Use song matching service to check for duplicates
-                is_duplicate = any(
-                    self.song_matcher.songs_match(song, existing_song)
-                    for existing_song in all_songs
+                normalized_title = self.song_matcher.normalize_title(song.title)
+                
+                # Same normalized title means titles_match() would accept it, so
+                # only fall back to pairwise fuzzy matching for unseen titles
+                is_duplicate = (
+                    normalized_title in seen_titles
+                    or self.song_matcher.match_any(song, all_songs)
                 )
                 
                 if not is_duplicate:
                     all_songs.append(song)
-                    seen_titles.add(song.title.lower())
+                    seen_titles.add(normalized_title)
                     
                     self.logger.debug(f"Added unique song: {song.title}")
                 else:
@@ -343,15 +467,8 @@ class ExtractionCoordinator:
         
         if new_result.song_count == current_best.song_count:
             # Same song count, prefer higher priority strategy
-            strategy_priority = {
-                "table_row": 10,
-                "youtube_link": 8,
-                "general_element": 5,
-                "text_parsing": 1
-            }
-            
-            new_priority = strategy_priority.get(new_result.strategy_used, 0)
-            current_priority = strategy_priority.get(current_best.strategy_used, 0)
+            new_priority = STRATEGY_PRIORITY.get(new_result.strategy_used, 0)
+            current_priority = STRATEGY_PRIORITY.get(current_best.strategy_used, 0)
             
             return new_priority > current_priority
         
@@ -359,21 +476,16 @@ class ExtractionCoordinator:
     
     def get_available_strategies(self) -> List[str]:
         """Get list of available strategy names."""
-        return [strategy.name for strategy in self.strategies]
+        if self._strategies is None:
+            self._create_strategies()
+        return list(self._strategy_by_name)
     
     def get_strategy_by_name(self, name: str) -> Optional[ExtractionStrategy]:
         """Get a specific strategy by name."""
-        for strategy in self.strategies:
-            if strategy.name == name:
-                return strategy
-        return None
+        if self._strategies is None:
+            self._create_strategies()
+        return self._strategy_by_name.get(name)
     
     def create_default_selectors(self) -> List[ElementSelector]:
         """Create a default set of selectors for common use cases."""
-        return [
-            ElementSelector.create_table_row(priority=10),
-            ElementSelector.create_youtube_links(priority=8),
-            ElementSelector.create_song_titles(priority=5),
-            ElementSelector.create_generic_links(priority=3),
-            ElementSelector.create_text_elements(priority=1)
-        ]
\ No newline at end of file
+        return list(_DEFAULT_SELECTORS)
\ No newline at end of file
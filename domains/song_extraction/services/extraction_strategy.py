@@ -1,13 +1,70 @@
 """Base extraction strategy interface for song extraction domain."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, TYPE_CHECKING
+from datetime import datetime
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Tuple, TYPE_CHECKING
+from urllib.parse import urlsplit
 import logging
+from selenium.webdriver.common.by import By
 
 from ..entities import ExtractionResult, ExtractionConfig, ElementSelector
+from ..entities.element_selector import SelectorType
 
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
+
+
+# Defines visibleText(element) for page scripts: an element's trimmed text,
+# or '' when it is hidden, as with WebElement.text. Prepend it to a script
+# so every strategy reads the page the same way.
+VISIBLE_TEXT_JS = """
+function visibleText(element) {
+    if (!(element.offsetWidth || element.offsetHeight ||
+          element.getClientRects().length)) {
+        return '';
+    }
+    return (element.innerText || '').trim();
+}
+"""
+
+# Defines isYouTubeHost(hostname) for page scripts, applying the same rule
+# as is_youtube_url() to a link's hostname
+YOUTUBE_HOST_JS = """
+function isYouTubeHost(host) {
+    host = (host || '').toLowerCase();
+    return host === 'youtube.com' || host === 'youtu.be' ||
+        host.slice(-12) === '.youtube.com';
+}
+"""
+
+
+@lru_cache(maxsize=1024)
+def is_youtube_url(value: Optional[str]) -> bool:
+    """Check whether a URL points to a YouTube host.
+    
+    The host must be youtube.com or youtu.be, or end in .youtube.com, so
+    URLs that only mention YouTube elsewhere don't match. Cached since the
+    same URLs come back across rows and retries.
+    """
+    if not value:
+        return False
+    try:
+        host = urlsplit(value).hostname or ''
+    except ValueError:
+        return False
+    return host in ('youtube.com', 'youtu.be') or host.endswith('.youtube.com')
+
+
+@lru_cache(maxsize=2)
+def _format_run_time(current_time: datetime) -> Tuple[str, str]:
+    """Format a run's time as an ISO timestamp and "%Y-%m-%d %H:%M:%S" text."""
+    scraped_at = "%04d-%02d-%02d %02d:%02d:%02d" % (
+        current_time.year, current_time.month, current_time.day,
+        current_time.hour, current_time.minute, current_time.second
+    )
+    return current_time.isoformat(), scraped_at
 
 
 class ExtractionStrategy(ABC):
@@ -18,6 +75,10 @@ class ExtractionStrategy(ABC):
     extraction approaches.
     """
     
+    # Selector types this strategy can run; empty means any type, leaving
+    # the decision entirely to can_handle()
+    SUPPORTED_SELECTOR_TYPES: FrozenSet[SelectorType] = frozenset()
+    
     def __init__(self, name: str, logger: Optional[logging.Logger] = None):
         """Initialize the extraction strategy.
         
@@ -59,6 +120,33 @@ class ExtractionStrategy(ABC):
         """
         pass
     
+    def _skipped_result(
+        self,
+        selector: ElementSelector,
+        config: ExtractionConfig
+    ) -> Optional[ExtractionResult]:
+        """Get an empty result if the config switches extraction off.
+        
+        A max_songs_per_strategy of 0 means extract nothing, so strategies
+        return this from extract_songs() before touching the page. None
+        means no limit.
+        
+        Args:
+            selector: Element selector being extracted
+            config: Configuration for extraction behavior
+            
+        Returns:
+            Empty successful result, or None if extraction should run
+        """
+        if config.max_songs_per_strategy != 0:
+            return None
+        return ExtractionResult.create_success(
+            songs=[],
+            strategy_used=self.name,
+            selector_used=selector.selector,
+            element_count=0
+        )
+    
     @property
     def strategy_name(self) -> str:
         """Get the name of this strategy."""
@@ -91,6 +179,51 @@ class ExtractionStrategy(ABC):
         """
         return True
     
+    def format_timestamps(self, current_time: datetime) -> Tuple[str, str]:
+        """Get the timestamp strings for songs found in one extraction run.
+        
+        Every song from a run shares the run's start time, so the strings
+        are formatted once and reused for each element.
+        
+        Args:
+            current_time: Time the extraction run started
+            
+        Returns:
+            Tuple of (ISO timestamp, "%Y-%m-%d %H:%M:%S" scraped_at text)
+        """
+        return _format_run_time(current_time)
+    
+    def find_elements(
+        self,
+        driver: "WebDriver",
+        selector: ElementSelector,
+        config: ExtractionConfig
+    ) -> List["WebElement"]:
+        """Find the elements matching a CSS selector.
+        
+        When the coordinator has put an "element_cache" dict in the config,
+        strategies sharing a selector during one extraction reuse a single
+        lookup instead of each querying the browser.
+        
+        Args:
+            driver: Selenium WebDriver instance
+            selector: Element selector to look up
+            config: Configuration that may carry the element cache
+            
+        Returns:
+            List of matching web elements
+        """
+        cache = config.get_custom_attribute("element_cache")
+        if cache is None:
+            return driver.find_elements(By.CSS_SELECTOR, selector.selector)
+        
+        key = (driver.session_id, selector.selector)
+        elements = cache.get(key)
+        if elements is None:
+            elements = driver.find_elements(By.CSS_SELECTOR, selector.selector)
+            cache[key] = elements
+        return elements
+    
     def __str__(self) -> str:
         """String representation of the strategy."""
         return f"{self.__class__.__name__}({self.name})"
@@ -1,11 +1,14 @@
 """General element extraction strategy for non-table web elements."""
 
 from datetime import datetime
-from typing import List, Optional, TYPE_CHECKING
+from itertools import islice
+from typing import Callable, Iterator, List, Optional, TYPE_CHECKING
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
 
-from .extraction_strategy import ExtractionStrategy
+from .extraction_strategy import ExtractionStrategy, VISIBLE_TEXT_JS, YOUTUBE_HOST_JS
 from ..entities import ExtractionResult, ExtractionConfig, ElementSelector
+from ..entities.element_selector import SelectorType
 from domains.music_queue.entities import SongRequest
 from domains.music_queue.services import SongMatchingService
 
@@ -13,6 +16,38 @@ if TYPE_CHECKING:
     from selenium.webdriver.remote.webdriver import WebDriver
 
 
+# How many times one element is re-found after going stale before giving up
+MAX_STALE_RETRIES = 2
+
+
+# Reads what extraction needs from one element: its visible text, the first
+# YouTube link inside it, and that link's text. Shared by the bulk and
+# per-element scripts so both paths see the page the same way.
+_READ_ELEMENT_JS = VISIBLE_TEXT_JS + YOUTUBE_HOST_JS + """
+function readElement(element, extractUrls) {
+    var data = {
+        text: visibleText(element),
+        youtube_url: '',
+        link_text: ''
+    };
+    
+    if (extractUrls) {
+        var links = element.getElementsByTagName('a');
+        for (var j = 0; j < links.length; j++) {
+            // Match on the host so URLs that merely mention YouTube are skipped
+            if (isYouTubeHost(links[j].hostname)) {
+                data.youtube_url = links[j].href;
+                data.link_text = (links[j].innerText || '').trim();
+                break;
+            }
+        }
+    }
+    
+    return data;
+}
+"""
+
+
 class GeneralElementExtractionStrategy(ExtractionStrategy):
     """Strategy for extracting songs from general web elements.
     
@@ -20,6 +55,9 @@ class GeneralElementExtractionStrategy(ExtractionStrategy):
     This is used for general content areas and fallback scenarios.
     """
     
+    # Elements are looked up with By.CSS_SELECTOR
+    SUPPORTED_SELECTOR_TYPES = frozenset({SelectorType.CSS})
+    
     def __init__(self):
         super().__init__("general_element")
         self.song_matcher = SongMatchingService()
@@ -44,6 +82,10 @@ class GeneralElementExtractionStrategy(ExtractionStrategy):
         config: ExtractionConfig
     ) -> ExtractionResult:
         """Extract songs from general web elements."""
+        skipped = self._skipped_result(selector, config)
+        if skipped is not None:
+            return skipped
+        
         try:
             if config.use_robust_finding:
                 return self._extract_songs_robust(driver, selector, config)
@@ -64,48 +106,62 @@ class GeneralElementExtractionStrategy(ExtractionStrategy):
         selector: ElementSelector,
         config: ExtractionConfig
     ) -> ExtractionResult:
-        """Extract songs using simple element finding."""
-        songs = []
+        """Extract songs from element data read by one script call."""
         current_time = datetime.now()
         
         try:
-            elements = driver.find_elements(By.CSS_SELECTOR, selector.selector)
-            element_count = len(elements)
-            
-            for i, element in enumerate(elements):
-                try:
-                    song_info = self._extract_from_element(
-                        element, i, current_time, selector.selector, config
-                    )
-                    if song_info:
-                        song_request = SongRequest.from_dict(song_info)
-                        songs.append(song_request)
-                        
-                        # Apply limit if configured
-                        if (config.max_songs_per_strategy and 
-                            len(songs) >= config.max_songs_per_strategy):
-                            break
-                        
-                except ValueError as e:
-                    self.logger.warning(f"Invalid song data from element {i}: {e}")
-                    continue
-                except Exception as e:
-                    self.logger.warning(f"Error extracting from element {i}: {e}")
-                    continue
-            
-            return ExtractionResult.create_success(
-                songs=songs,
-                strategy_used=self.name,
-                selector_used=selector.selector,
-                element_count=element_count
-            )
-            
+            # Read every element's text and link in one browser round-trip
+            element_data = self._bulk_extract_element_data(driver, selector, config)
         except Exception as e:
             return ExtractionResult.create_failure(
                 error_message=str(e),
                 strategy_used=self.name,
-                selector_used=selector.selector
+                selector_used=selector.selector,
+                timestamp=current_time
             )
+        
+        return self._songs_from_element_data(selector, element_data, current_time, config)
+    
+    def _songs_from_element_data(
+        self,
+        selector: ElementSelector,
+        element_data: List[dict],
+        current_time: datetime,
+        config: ExtractionConfig
+    ) -> ExtractionResult:
+        """Build the extraction result for one selector from its script-read element data."""
+        build_song = self._song_builder(selector.selector, current_time, config)
+        songs = list(islice(
+            self._iter_songs_from_element_data(element_data, build_song),
+            config.max_songs_per_strategy
+        ))
+        
+        return ExtractionResult.create_success(
+            songs=songs,
+            strategy_used=self.name,
+            selector_used=selector.selector,
+            element_count=len(element_data),
+            timestamp=current_time
+        )
+    
+    def _iter_songs_from_element_data(
+        self,
+        element_data: List[dict],
+        build_song: Callable[[str, str, str, int], Optional[SongRequest]]
+    ) -> Iterator[SongRequest]:
+        """Yield a song for each script-read element that passes the filters."""
+        for i, data in enumerate(element_data):
+            try:
+                song = build_song(
+                    data["text"], data["youtube_url"], data["link_text"], i
+                )
+                if song:
+                    yield song
+                    
+            except ValueError as e:
+                self.logger.warning(f"Invalid song data from element {i}: {e}")
+            except Exception as e:
+                self.logger.warning(f"Error extracting from element {i}: {e}")
     
     def _extract_songs_robust(
         self,
@@ -113,180 +169,176 @@ class GeneralElementExtractionStrategy(ExtractionStrategy):
         selector: ElementSelector,
         config: ExtractionConfig
     ) -> ExtractionResult:
-        """Extract songs using robust re-finding approach."""
-        songs = []
+        """Extract songs, re-finding elements only when they go stale."""
         current_time = datetime.now()
         
         try:
-            # Re-find elements each time to avoid stale references
             elements = driver.find_elements(By.CSS_SELECTOR, selector.selector)
             element_count = len(elements)
             
-            for i in range(element_count):
-                try:
-                    song_info = self._extract_from_element_robust(
-                        driver, selector.selector, i, current_time, config
-                    )
-                    if song_info:
-                        song_request = SongRequest.from_dict(song_info)
-                        songs.append(song_request)
-                        
-                        # Apply limit if configured
-                        if (config.max_songs_per_strategy and 
-                            len(songs) >= config.max_songs_per_strategy):
-                            break
-                        
-                except ValueError as e:
-                    self.logger.warning(f"Invalid song data from element {i}: {e}")
-                    continue
-                except Exception as e:
-                    self.logger.debug(f"Error extracting from element {i}: {e}")
-                    continue
+            build_song = self._song_builder(selector.selector, current_time, config)
+            songs = list(islice(
+                self._iter_songs_robust(driver, selector, elements, build_song, config),
+                config.max_songs_per_strategy
+            ))
             
             return ExtractionResult.create_success(
                 songs=songs,
                 strategy_used=self.name,
                 selector_used=selector.selector,
-                element_count=element_count
+                element_count=element_count,
+                timestamp=current_time
             )
             
         except Exception as e:
             return ExtractionResult.create_failure(
                 error_message=str(e),
                 strategy_used=self.name,
-                selector_used=selector.selector
+                selector_used=selector.selector,
+                timestamp=current_time
             )
     
+    def _iter_songs_robust(
+        self,
+        driver: "WebDriver",
+        selector: ElementSelector,
+        elements: list,
+        build_song: Callable[[str, str, str, int], Optional[SongRequest]],
+        config: ExtractionConfig
+    ) -> Iterator[SongRequest]:
+        """Yield a song for each element that passes the filters, re-finding stale elements."""
+        for i in range(len(elements)):
+            if i >= len(elements):
+                # The page lost elements since they were re-found
+                return
+            
+            try:
+                for attempt in range(MAX_STALE_RETRIES + 1):
+                    try:
+                        song = self._extract_from_element(
+                            driver, elements[i], i, build_song, config
+                        )
+                        break
+                    except StaleElementReferenceException:
+                        if attempt == MAX_STALE_RETRIES:
+                            raise
+                        # The DOM changed; re-find once and resume at this index
+                        elements = driver.find_elements(By.CSS_SELECTOR, selector.selector)
+                        if i >= len(elements):
+                            raise
+                
+                if song:
+                    yield song
+                    
+            except ValueError as e:
+                self.logger.warning(f"Invalid song data from element {i}: {e}")
+            except Exception as e:
+                self.logger.debug(f"Error extracting from element {i}: {e}")
+    
+    def _bulk_extract_element_data(
+        self,
+        driver: "WebDriver",
+        selector: ElementSelector,
+        config: ExtractionConfig
+    ) -> List[dict]:
+        """Get text and YouTube link data for all of a selector's elements in one script call."""
+        js_code = _READ_ELEMENT_JS + """
+        var elements = document.querySelectorAll(arguments[0]);
+        var results = [];
+        
+        for (var i = 0; i < elements.length; i++) {
+            results.push(readElement(elements[i], arguments[1]));
+        }
+        
+        return results;
+        """
+        
+        return driver.execute_script(js_code, selector.selector, config.extract_youtube_urls) or []
+    
+    def _read_element_js(self, driver: "WebDriver", element, config: ExtractionConfig) -> dict:
+        """Read an element's text, YouTube link and link text in one script call."""
+        js_code = _READ_ELEMENT_JS + """
+        return readElement(arguments[0], arguments[1]);
+        """
+        return driver.execute_script(js_code, element, config.extract_youtube_urls)
+    
     def _extract_from_element(
         self,
+        driver: "WebDriver",
         element,
         index: int,
-        current_time: datetime,
-        selector_used: str,
+        build_song: Callable[[str, str, str, int], Optional[SongRequest]],
         config: ExtractionConfig
-    ) -> Optional[dict]:
-        """Extract song info from a general web element."""
+    ) -> Optional[SongRequest]:
+        """Extract a song from a general web element."""
         try:
-            # Get all text content
-            element_text = element.text.strip()
-            
-            # Skip empty or very short elements
-            if config.skip_empty_elements and len(element_text) < config.min_title_length:
-                return None
-            
-            # Look for YouTube links within the element
-            youtube_url = ""
-            if config.extract_youtube_urls:
-                try:
-                    links = element.find_elements(By.TAG_NAME, "a")
-                    for link in links:
-                        href = link.get_attribute("href")
-                        if href and ("youtube.com" in href or "youtu.be" in href):
-                            youtube_url = href
-                            break
-                except:
-                    pass
-            
-            # Extract title - prefer link text if available, otherwise use element text
-            title = ""
-            if youtube_url:
-                try:
-                    link_element = element.find_element(
-                        By.XPATH, f".//a[@href='{youtube_url}']"
-                    )
-                    title = link_element.text.strip()
-                except:
-                    pass
-            
-            if not title:
-                title = element_text
-            
-            # Clean up the title if configured
-            if config.clean_titles:
-                title = self.song_matcher.clean_song_title(title)
-            
-            # Apply filtering
-            if len(title) < config.min_title_length:
-                return None
-                
-            if len(title) > config.max_title_length:
-                return None
-                
-            if config.skip_ui_text and self.song_matcher.is_ui_text(title):
-                return None
-            
-            return {
-                "title": title,
-                "youtube_url": youtube_url,
-                "timestamp": current_time.isoformat(),
-                "scraped_at": current_time.strftime("%Y-%m-%d %H:%M:%S"),
-                "selector_used": selector_used,
-                "element_index": index
-            }
+            data = self._read_element_js(driver, element, config)
+            return build_song(data["text"], data["youtube_url"], data["link_text"], index)
             
+        except (StaleElementReferenceException, ValueError):
+            # Staleness is retried by the caller; invalid song data is logged there
+            raise
         except Exception as e:
             self.logger.debug(f"Error extracting from element {index}: {e}")
             return None
     
-    def _extract_from_element_robust(
+    def _song_builder(
         self,
-        driver: "WebDriver",
-        selector: str,
-        element_index: int,
+        selector_used: str,
         current_time: datetime,
         config: ExtractionConfig
-    ) -> Optional[dict]:
-        """Extract song info from element using robust re-finding approach."""
-        try:
-            # Re-find the specific element by index each time
-            current_elements = driver.find_elements(By.CSS_SELECTOR, selector)
-            if element_index >= len(current_elements):
-                return None
-                
-            element = current_elements[element_index]
-            
-            # General extraction for other selectors
-            element_text = element.text.strip()
-            if config.skip_empty_elements and len(element_text) < config.min_title_length:
+    ) -> Callable[[str, str, str, int], Optional[SongRequest]]:
+        """Get a function that builds a song from an element's text and YouTube link.
+        
+        The function returns None for elements the config filters out. The
+        config's filter settings and the run's timestamps are read once
+        here and bound to the returned function, which runs once per element.
+        """
+        skip_empty_elements = config.skip_empty_elements
+        min_title_length = config.min_title_length
+        max_title_length = config.max_title_length
+        clean_titles = config.clean_titles
+        skip_ui_text = config.skip_ui_text
+        clean_song_title = self.song_matcher.clean_song_title
+        is_ui_text = self.song_matcher.is_ui_text
+        _, scraped_at = self.format_timestamps(current_time)
+        
+        def build_song(
+            element_text: str,
+            youtube_url: str,
+            link_text: str,
+            index: int
+        ) -> Optional[SongRequest]:
+            # Skip empty or very short elements
+            if skip_empty_elements and len(element_text) < min_title_length:
                 return None
             
-            # Look for YouTube links
-            youtube_url = ""
-            if config.extract_youtube_urls:
-                try:
-                    links = element.find_elements(By.TAG_NAME, "a")
-                    for link in links:
-                        href = link.get_attribute("href")
-                        if href and ("youtube.com" in href or "youtu.be" in href):
-                            youtube_url = href
-                            break
-                except:
-                    pass
+            # Extract title - prefer link text if available, otherwise use element text
+            title = link_text or element_text
             
-            # Extract and clean title
-            title = element_text
-            if config.clean_titles:
-                title = self.song_matcher.clean_song_title(title)
+            # Clean up the title if configured
+            if clean_titles:
+                title = clean_song_title(title)
             
             # Apply filtering
-            if len(title) < config.min_title_length:
+            if len(title) < min_title_length:
                 return None
                 
-            if len(title) > config.max_title_length:
+            if len(title) > max_title_length:
                 return None
                 
-            if config.skip_ui_text and self.song_matcher.is_ui_text(title):
+            if skip_ui_text and is_ui_text(title):
                 return None
             
-            return {
-                "title": title,
-                "youtube_url": youtube_url,
-                "timestamp": current_time.isoformat(),
-                "scraped_at": current_time.strftime("%Y-%m-%d %H:%M:%S"),
-                "selector_used": selector,
-                "element_index": element_index
-            }
-            
-        except Exception as e:
-            self.logger.debug(f"Error extracting from element {element_index} with {selector}: {e}")
-            return None
\ No newline at end of file
+            # Built directly rather than through from_dict, which would parse
+            # the timestamp back out of a string for every song
+            return SongRequest(
+                title=title,
+                youtube_url=youtube_url,
+                timestamp=current_time,
+                scraped_at=scraped_at,
+                selector_used=selector_used,
+                element_index=index
+            )
+        
+        return build_song
@@ -1,14 +1,18 @@
 """Table row extraction strategy for Moobot-specific table structures."""
 
-import time
 import re
 import urllib.parse
 from datetime import datetime
-from typing import List, Optional, TYPE_CHECKING
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 
-from .extraction_strategy import ExtractionStrategy
+from .extraction_strategy import ExtractionStrategy, VISIBLE_TEXT_JS, is_youtube_url
 from ..entities import ExtractionResult, ExtractionConfig, ElementSelector
+from ..entities.element_selector import SelectorType
 from domains.music_queue.entities import SongRequest
 from domains.music_queue.services import SongMatchingService
 
@@ -16,6 +20,67 @@ if TYPE_CHECKING:
     from selenium.webdriver.remote.webdriver import WebDriver
 
 
+_YT_URL_RE = re.compile(r'https?://(?:www\.)?(?:youtube\.com|youtu\.be)/[^\s"\'>\)]+')
+_YT_VID_RE = re.compile(r'/vi/([^/]+)/')
+_STATUS_RE = re.compile(r'Playing|next|minutes')
+
+# Suffixes dropped from search queries since they might not be in YouTube titles
+_SEARCH_SUFFIXES = (
+    ' (Official Video)', ' (Official Audio)', ' (Official)',
+    ' (Lyrics)', ' M/V'
+)
+
+# Installs the button inspector on the page once, so later calls only ship
+# the short _CALL_INSPECT_BUTTON_JS instead of the whole function source
+_INSTALL_INSPECT_BUTTON_JS = """
+window.__moobotInspectButton = function(button) {
+    var result = {};
+    
+    // Check various attributes that might contain the URL
+    result.dataUrl = button.getAttribute('data-url');
+    result.dataHref = button.getAttribute('data-href');
+    result.dataLink = button.getAttribute('data-link');
+    result.onclick = button.onclick ? button.onclick.toString() : null;
+    
+    // Check parent elements for data
+    var parent = button.parentElement;
+    if (parent) {
+        result.parentDataUrl = parent.getAttribute('data-url');
+        result.parentDataHref = parent.getAttribute('data-href');
+    }
+    
+    return result;
+};
+return window.__moobotInspectButton(arguments[0]);
+"""
+
+# Returns null when the inspector isn't installed on the current page
+_CALL_INSPECT_BUTTON_JS = """
+var inspect = window.__moobotInspectButton;
+return inspect ? inspect(arguments[0]) : null;
+"""
+
+
+@lru_cache(maxsize=4096)
+def _youtube_search_url(song_title: str) -> str:
+    """Build the YouTube search URL for a song title.
+    
+    Cached since a title stays in the queue, and so gets the same search
+    URL, across many consecutive scrapes.
+    """
+    search_query = song_title.strip()
+    
+    # Remove common suffixes that might not be in YouTube titles
+    if search_query.endswith(_SEARCH_SUFFIXES):
+        for suffix in _SEARCH_SUFFIXES:
+            if search_query.endswith(suffix):
+                search_query = search_query[:-len(suffix)].strip()
+                break
+    
+    encoded_query = urllib.parse.quote_plus(search_query)
+    return f"https://www.youtube.com/results?search_query={encoded_query}"
+
+
 class TableRowExtractionStrategy(ExtractionStrategy):
     """Strategy for extracting songs from table rows in Moobot interface.
     
@@ -23,6 +88,9 @@ class TableRowExtractionStrategy(ExtractionStrategy):
     and YouTube URL extraction through various methods.
     """
     
+    # Elements are looked up with By.CSS_SELECTOR
+    SUPPORTED_SELECTOR_TYPES = frozenset({SelectorType.CSS})
+    
     def __init__(self):
         super().__init__("table_row")
         self.song_matcher = SongMatchingService()
@@ -46,6 +114,10 @@ class TableRowExtractionStrategy(ExtractionStrategy):
         config: ExtractionConfig
     ) -> ExtractionResult:
         """Extract songs from table rows."""
+        skipped = self._skipped_result(selector, config)
+        if skipped is not None:
+            return skipped
+        
         try:
             if config.use_robust_finding:
                 return self._extract_songs_robust(driver, selector, config)
@@ -66,42 +138,34 @@ class TableRowExtractionStrategy(ExtractionStrategy):
         selector: ElementSelector, 
         config: ExtractionConfig
     ) -> ExtractionResult:
-        """Extract songs using simple element finding."""
-        songs = []
+        """Extract songs from the rows' titles, labels and direct link buttons."""
         current_time = datetime.now()
         
         try:
-            elements = driver.find_elements(By.CSS_SELECTOR, selector.selector)
-            element_count = len(elements)
+            # Read every row in one browser round-trip
+            rows = self._bulk_extract_rows(driver, selector.selector)
+            element_count = len(rows)
+            existing_urls = config.get_custom_attribute("existing_youtube_urls", {})
             
-            for i, element in enumerate(elements):
-                try:
-                    song_info = self._extract_from_table_row(
-                        element, i, current_time, config
-                    )
-                    if song_info:
-                        song_request = SongRequest.from_dict(song_info)
-                        songs.append(song_request)
-                        
-                except ValueError as e:
-                    self.logger.warning(f"Invalid song data from row {i}: {e}")
-                    continue
-                except Exception as e:
-                    self.logger.warning(f"Error extracting from row {i}: {e}")
-                    continue
+            songs = list(self._iter_songs_from_rows(
+                driver, selector, rows, current_time, config,
+                robust=False, existing_urls=existing_urls
+            ))
             
             return ExtractionResult.create_success(
                 songs=songs,
                 strategy_used=self.name,
                 selector_used=selector.selector,
-                element_count=element_count
+                element_count=element_count,
+                timestamp=current_time
             )
             
         except Exception as e:
             return ExtractionResult.create_failure(
                 error_message=str(e),
                 strategy_used=self.name,
-                selector_used=selector.selector
+                selector_used=selector.selector,
+                timestamp=current_time
             )
     
     def _extract_songs_robust(
@@ -110,247 +174,210 @@ class TableRowExtractionStrategy(ExtractionStrategy):
         selector: ElementSelector,
         config: ExtractionConfig
     ) -> ExtractionResult:
-        """Extract songs using robust re-finding approach."""
-        songs = []
+        """Extract songs with row text fallbacks and every YouTube URL method."""
         current_time = datetime.now()
         
         try:
-            # Re-find elements each time to avoid stale references
-            elements = driver.find_elements(By.CSS_SELECTOR, selector.selector)
-            element_count = len(elements)
+            # A single snapshot of the rows can't go stale, unlike live elements
+            rows = self._bulk_extract_rows(driver, selector.selector)
+            element_count = len(rows)
+            existing_urls = config.get_custom_attribute("existing_youtube_urls", {})
             
-            for i in range(element_count):
-                try:
-                    song_info = self._extract_from_table_row_robust(
-                        driver, selector.selector, i, current_time, config
-                    )
-                    if song_info:
-                        song_request = SongRequest.from_dict(song_info)
-                        songs.append(song_request)
-                        
-                except ValueError as e:
-                    self.logger.warning(f"Invalid song data from row {i}: {e}")
-                    continue
-                except Exception as e:
-                    self.logger.debug(f"Error extracting from row {i}: {e}")
-                    continue
+            # Read the history table once for the whole pass, not once per row
+            history_urls: Dict[str, str] = {}
+            if config.extract_youtube_urls and config.try_history_thumbnails:
+                history_urls = self._build_history_url_map(driver)
+            
+            # Live row elements, found on first use by _find_live_link_button
+            live_rows: list = []
+            
+            songs = list(self._iter_songs_from_rows(
+                driver, selector, rows, current_time, config,
+                robust=True, existing_urls=existing_urls,
+                history_urls=history_urls, live_rows=live_rows
+            ))
             
             return ExtractionResult.create_success(
                 songs=songs,
                 strategy_used=self.name,
                 selector_used=selector.selector,
-                element_count=element_count
+                element_count=element_count,
+                timestamp=current_time
             )
             
         except Exception as e:
             return ExtractionResult.create_failure(
                 error_message=str(e),
                 strategy_used=self.name,
-                selector_used=selector.selector
+                selector_used=selector.selector,
+                timestamp=current_time
             )
     
-    def _extract_from_table_row(
-        self, 
-        row_element,
-        index: int,
+    def _iter_songs_from_rows(
+        self,
+        driver: "WebDriver",
+        selector: ElementSelector,
+        rows: List[dict],
         current_time: datetime,
-        config: ExtractionConfig
-    ) -> Optional[dict]:
-        """Extract song info from a single table row element."""
-        try:
-            # Look for the song title in Moobot's specific structure
-            song_title_element = row_element.find_element(
-                By.CSS_SELECTOR, ".moobot-input-label-text-text"
-            )
-            if not song_title_element:
-                return None
-                
-            title = song_title_element.text.strip()
-            
-            # Apply filtering
-            if not title or len(title) < config.min_title_length:
-                return None
-            
-            if config.skip_ui_text and self.song_matcher.is_ui_text(title):
-                return None
-            
-            # Clean title if configured
-            if config.clean_titles:
-                title = self.song_matcher.clean_song_title(title)
-            
-            # Extract metadata
-            duration = ""
-            requester = ""
-            status = ""
-            
-            if config.extract_metadata:
-                try:
-                    labels = row_element.find_elements(
-                        By.CSS_SELECTOR, ".moobot-input-label-text-label"
-                    )
-                    for label in labels:
-                        label_text = label.text.strip()
-                        if ":" in label_text and len(label_text) < 10:
-                            duration = label_text
-                        elif "By " in label_text:
-                            requester = label_text
-                        elif any(status_word in label_text 
-                               for status_word in ["Playing", "next", "minutes"]):
-                            status = label_text
-                except:
-                    pass
-            
-            # Extract YouTube URL with optimization
-            youtube_url = ""
-            if config.extract_youtube_urls:
-                # Check if we already have URL for this song (optimization)
-                existing_urls = config.get_custom_attribute("existing_youtube_urls", {})
-                title_lower = title.lower()
-                
-                if title_lower in existing_urls:
-                    youtube_url = existing_urls[title_lower]
-                    self.logger.debug(f"Reused existing YouTube URL for: {title}")
-                else:
-                    # Only extract if we don't already have it
-                    youtube_url = self._extract_youtube_url_simple(
-                        row_element, title, config
-                    )
-            
-            # Create enhanced title with metadata
-            enhanced_title = title
-            if duration:
-                enhanced_title += f" [{duration}]"
-            if requester:
-                enhanced_title += f" - {requester}"
-            if status:
-                enhanced_title += f" ({status})"
-            
-            return {
-                "title": title,
-                "enhanced_title": enhanced_title,
-                "duration": duration,
-                "requester": requester,
-                "status": status,
-                "youtube_url": youtube_url,
-                "timestamp": current_time.isoformat(),
-                "scraped_at": current_time.strftime("%Y-%m-%d %H:%M:%S"),
-                "selector_used": "tr",
-                "element_index": index
+        config: ExtractionConfig,
+        robust: bool,
+        existing_urls: Optional[Dict[str, str]] = None,
+        history_urls: Optional[Dict[str, str]] = None,
+        live_rows: Optional[list] = None
+    ) -> Iterator[SongRequest]:
+        """Yield a song for each row read by _bulk_extract_rows that passes the filters."""
+        # Failed rows are routine on the robust path, which tries every fallback
+        log_row_error = self.logger.debug if robust else self.logger.warning
+        
+        for i, row in enumerate(rows):
+            try:
+                song = self._build_song_from_payload(
+                    driver, selector, row, i, current_time, config,
+                    robust=robust, existing_urls=existing_urls,
+                    history_urls=history_urls, live_rows=live_rows
+                )
+                if song:
+                    yield song
+                    
+            except ValueError as e:
+                self.logger.warning(f"Invalid song data from row {i}: {e}")
+            except Exception as e:
+                log_row_error(f"Error extracting from row {i}: {e}")
+    
+    def _bulk_extract_rows(self, driver: "WebDriver", selector: str) -> List[dict]:
+        """Read the title, labels and link attributes of every row in one script call."""
+        js_code = VISIBLE_TEXT_JS + """
+        var rows = document.querySelectorAll(arguments[0]);
+        var results = [];
+        
+        for (var i = 0; i < rows.length; i++) {
+            var row = rows[i];
+            var titleElement = row.querySelector('.moobot-input-label-text-text');
+            
+            var labels = [];
+            var labelElements = row.querySelectorAll('.moobot-input-label-text-label');
+            for (var j = 0; j < labelElements.length; j++) {
+                labels.push(visibleText(labelElements[j]));
             }
             
-        except Exception as e:
-            self.logger.debug(f"Error extracting from table row {index}: {e}")
-            return None
+            var button = row.querySelector('button.button-type-link');
+            var link = row.querySelector("button[class*='button-type-link'], a[href*='youtube']");
+            
+            results.push({
+                title: titleElement ? visibleText(titleElement) : null,
+                first_line: visibleText(row).split('\\n')[0],
+                labels: labels,
+                button_data_url: button ? button.getAttribute('data-url') : null,
+                has_link: !!link,
+                link_data_url: link ? link.getAttribute('data-url') : null,
+                link_href: link ? (link.href || link.getAttribute('href')) : null
+            });
+        }
+        
+        return results;
+        """
+        
+        return driver.execute_script(js_code, selector) or []
     
-    def _extract_from_table_row_robust(
+    def _build_song_from_payload(
         self,
         driver: "WebDriver",
-        selector: str,
-        row_index: int,
+        selector: ElementSelector,
+        payload: dict,
+        index: int,
         current_time: datetime,
-        config: ExtractionConfig
-    ) -> Optional[dict]:
-        """Extract song info from table row using robust re-finding approach."""
-        try:
-            # Re-find the table rows
-            rows = driver.find_elements(By.CSS_SELECTOR, selector)
-            if row_index >= len(rows):
-                return None
-                
-            row = rows[row_index]
-            
-            # Extract song title
-            title = ""
-            try:
-                title_element = row.find_element(
-                    By.CSS_SELECTOR, ".moobot-input-label-text-text"
-                )
-                title = title_element.text.strip()
-            except:
-                # Fallback to row text
-                title = row.text.strip().split('\\n')[0] if row.text.strip() else ""
-            
-            if not title or len(title) < config.min_title_length:
-                return None
-            
-            if config.skip_ui_text and self.song_matcher.is_ui_text(title):
+        config: ExtractionConfig,
+        robust: bool,
+        existing_urls: Optional[Dict[str, str]] = None,
+        history_urls: Optional[Dict[str, str]] = None,
+        live_rows: Optional[list] = None
+    ) -> Optional[SongRequest]:
+        """Build a song from one row read by _bulk_extract_rows.
+        
+        The robust variant falls back to the row's first line of text when
+        there is no title element, and tries every YouTube URL method, using
+        history_urls from _build_history_url_map for the history thumbnails
+        and sharing live_rows between rows that need their live link button.
+        URLs already known for a lowercased title are taken from existing_urls.
+        """
+        title = payload["title"]
+        if title is None:
+            if not robust:
                 return None
-                
-            if config.clean_titles:
-                title = self.song_matcher.clean_song_title(title)
-            
-            # Extract metadata
-            duration = ""
-            requester = ""
-            status = ""
-            
-            if config.extract_metadata:
-                try:
-                    labels = row.find_elements(
-                        By.CSS_SELECTOR, ".moobot-input-label-text-label"
-                    )
-                    for label in labels:
-                        label_text = label.text.strip()
-                        if ":" in label_text and len(label_text) < 10:
-                            duration = label_text
-                        elif label_text.startswith("By "):
-                            requester = label_text
-                        elif any(status_word in label_text 
-                               for status_word in ["Playing", "next", "minutes"]):
-                            status = label_text
-                except:
-                    pass
-            
-            # Extract YouTube URL using comprehensive approach with optimization
-            youtube_url = ""
-            if config.extract_youtube_urls:
-                # Check if we already have URL for this song (optimization)
-                existing_urls = config.get_custom_attribute("existing_youtube_urls", {})
-                title_lower = title.lower()
-                
-                if title_lower in existing_urls:
-                    youtube_url = existing_urls[title_lower]
-                    self.logger.debug(f"Reused existing YouTube URL for: {title}")
-                else:
-                    # Only extract if we don't already have it
-                    youtube_url = self._extract_youtube_url_comprehensive(
-                        driver, row, title, config
-                    )
-            
-            return {
-                "title": title,
-                "duration": duration,
-                "requester": requester,
-                "status": status,
-                "youtube_url": youtube_url,
-                "timestamp": current_time.isoformat(),
-                "scraped_at": current_time.strftime("%Y-%m-%d %H:%M:%S"),
-                "selector_used": selector,
-                "element_index": row_index
-            }
-            
-        except Exception as e:
-            self.logger.debug(f"Error extracting from table row {row_index}: {e}")
+            # Fallback to row text
+            title = payload["first_line"]
+        
+        # Apply filtering
+        if not title or len(title) < config.min_title_length:
+            return None
+        
+        if config.skip_ui_text and self.song_matcher.is_ui_text(title):
             return None
+        
+        # Clean title if configured
+        if config.clean_titles:
+            title = self.song_matcher.clean_song_title(title)
+        
+        # Extract metadata
+        duration = ""
+        requester = ""
+        status = ""
+        
+        if config.extract_metadata:
+            for label_text in payload["labels"]:
+                if ":" in label_text and len(label_text) < 10:
+                    duration = label_text
+                elif label_text.startswith("By "):
+                    requester = label_text
+                elif _STATUS_RE.search(label_text):
+                    status = label_text
+        
+        # Extract YouTube URL with optimization
+        youtube_url = ""
+        if config.extract_youtube_urls:
+            # Check if we already have URL for this song (optimization),
+            # lowercasing the title only when there is something to look up
+            known_url = existing_urls.get(title.lower()) if existing_urls else None
+            
+            if known_url is not None:
+                youtube_url = known_url
+                self.logger.debug(f"Reused existing YouTube URL for: {title}")
+            elif robust:
+                # Only extract if we don't already have it
+                youtube_url = self._extract_youtube_url_comprehensive(
+                    driver, selector.selector, index, payload, title, config,
+                    history_urls or {}, [] if live_rows is None else live_rows
+                )
+            else:
+                youtube_url = self._extract_youtube_url_simple(payload, title, config)
+        
+        _, scraped_at = self.format_timestamps(current_time)
+        
+        # Built directly rather than through from_dict, which would parse
+        # the timestamp back out of a string for every row
+        return SongRequest(
+            title=title,
+            duration=duration,
+            requester=requester,
+            status=status,
+            youtube_url=youtube_url,
+            timestamp=current_time,
+            scraped_at=scraped_at,
+            selector_used=selector.selector if robust else "tr",
+            element_index=index
+        )
     
     def _extract_youtube_url_simple(
         self, 
-        row_element, 
+        payload: dict, 
         song_title: str, 
         config: ExtractionConfig
     ) -> str:
-        """Simple YouTube URL extraction from table row."""
-        try:
-            if config.try_direct_links:
-                link_button = row_element.find_element(
-                    By.CSS_SELECTOR, "button.button-type-link"
-                )
-                if link_button:
-                    data_url = link_button.get_attribute("data-url")
-                    if data_url and ("youtube.com" in data_url or "youtu.be" in data_url):
-                        return data_url
-        except:
-            pass
+        """Simple YouTube URL extraction from a row's link button."""
+        if config.try_direct_links:
+            data_url = payload["button_data_url"]
+            if is_youtube_url(data_url):
+                return data_url
         
         # Fallback to search if configured
         if config.fallback_to_search:
@@ -361,43 +388,47 @@ class TableRowExtractionStrategy(ExtractionStrategy):
     def _extract_youtube_url_comprehensive(
         self,
         driver: "WebDriver",
-        row_element,
+        row_selector: str,
+        row_index: int,
+        payload: dict,
         song_title: str,
-        config: ExtractionConfig
+        config: ExtractionConfig,
+        history_urls: Dict[str, str],
+        live_rows: list
     ) -> str:
         """Comprehensive YouTube URL extraction with multiple methods."""
         
         # Method 1: Try direct links
-        if config.try_direct_links:
-            try:
-                link_button = row_element.find_element(
-                    By.CSS_SELECTOR, 
-                    "button[class*='button-type-link'], a[href*='youtube']"
-                )
-                if link_button:
-                    data_url = link_button.get_attribute("data-url")
-                    href = link_button.get_attribute("href")
-                    
-                    if data_url and ("youtube.com" in data_url or "youtu.be" in data_url):
-                        return data_url
-                    elif href and ("youtube.com" in href or "youtu.be" in href):
-                        return href
-                    
-                    # Try comprehensive extraction from button
-                    if config.try_button_click or config.try_javascript_extraction:
+        if config.try_direct_links and payload["has_link"]:
+            data_url = payload["link_data_url"]
+            href = payload["link_href"]
+            
+            if is_youtube_url(data_url):
+                return data_url
+            elif is_youtube_url(href):
+                return href
+            
+            # Try comprehensive extraction from button
+            if config.try_button_click or config.try_javascript_extraction:
+                try:
+                    # Only now is the live button element needed
+                    link_button = self._find_live_link_button(
+                        driver, row_selector, row_index, live_rows
+                    )
+                    if link_button is not None:
                         url = self._extract_youtube_url_from_button(
                             driver, link_button, song_title, config
                         )
                         if url:
                             return url
                             
-            except Exception as e:
-                self.logger.debug(f"Direct link extraction failed: {e}")
+                except Exception as e:
+                    self.logger.debug(f"Direct link extraction failed: {e}")
         
         # Method 2: Try history thumbnails
         if config.try_history_thumbnails:
             url = self._extract_from_history_thumbnails(
-                driver, song_title
+                history_urls, song_title
             )
             if url:
                 return url
@@ -408,6 +439,33 @@ class TableRowExtractionStrategy(ExtractionStrategy):
         
         return ""
     
+    def _find_live_link_button(
+        self,
+        driver: "WebDriver",
+        row_selector: str,
+        row_index: int,
+        live_rows: list
+    ):
+        """Find a row's live link button, or None if the row is gone.
+        
+        live_rows holds the pass's row elements. It is filled on first use
+        and only re-read when its rows have gone stale.
+        """
+        for attempt in range(2):
+            if attempt or not live_rows:
+                live_rows[:] = driver.find_elements(By.CSS_SELECTOR, row_selector)
+            if row_index >= len(live_rows):
+                return None
+            
+            try:
+                return live_rows[row_index].find_element(
+                    By.CSS_SELECTOR, 
+                    "button[class*='button-type-link'], a[href*='youtube']"
+                )
+            except StaleElementReferenceException:
+                if attempt:
+                    raise
+    
     def _extract_youtube_url_from_button(
         self,
         driver: "WebDriver", 
@@ -417,15 +475,16 @@ class TableRowExtractionStrategy(ExtractionStrategy):
     ) -> str:
         """Extract YouTube URL from Moobot's external link buttons."""
         
-        # Method 1: Try button click (if enabled and safe)
-        if config.try_button_click:
-            url = self._extract_via_button_click(driver, button_element, config)
+        # Method 1: Try JavaScript extraction, which reads the button's
+        # attributes and onclick source without opening a tab
+        if config.try_javascript_extraction:
+            url = self._extract_via_javascript(driver, button_element)
             if url:
                 return url
         
-        # Method 2: Try JavaScript extraction
-        if config.try_javascript_extraction:
-            url = self._extract_via_javascript(driver, button_element)
+        # Method 2: Try button click (if enabled and safe)
+        if config.try_button_click:
+            url = self._extract_via_button_click(driver, button_element, config)
             if url:
                 return url
         
@@ -448,16 +507,26 @@ class TableRowExtractionStrategy(ExtractionStrategy):
             # Click the button to open YouTube
             driver.execute_script("arguments[0].click();", button_element)
             
-            # Wait for new window
-            time.sleep(2)
+            # Wait for new window, returning as soon as it opens
+            try:
+                WebDriverWait(driver, config.new_window_timeout).until(
+                    EC.new_window_is_opened(original_windows)
+                )
+            except TimeoutException:
+                return ""
             
             new_windows = driver.window_handles
             if len(new_windows) > len(original_windows):
                 new_window = [w for w in new_windows if w not in original_windows][0]
                 driver.switch_to.window(new_window)
                 
-                # Minimal wait and audio control
-                time.sleep(0.5)
+                # Wait for the tab to reach YouTube; read whatever URL it has otherwise
+                try:
+                    WebDriverWait(driver, config.new_window_url_timeout).until(
+                        lambda d: is_youtube_url(d.current_url)
+                    )
+                except TimeoutException:
+                    pass
                 
                 if config.mute_audio or config.pause_videos:
                     self._control_video_playback(driver, config)
@@ -469,7 +538,7 @@ class TableRowExtractionStrategy(ExtractionStrategy):
                     driver.close()
                     driver.switch_to.window(original_windows[0])
                 
-                if "youtube.com" in current_url or "youtu.be" in current_url:
+                if is_youtube_url(current_url):
                     self.logger.info(f"Found YouTube URL via button click: {current_url}")
                     return current_url
                     
@@ -478,7 +547,7 @@ class TableRowExtractionStrategy(ExtractionStrategy):
             # Make sure we're back to original window
             try:
                 driver.switch_to.window(driver.window_handles[0])
-            except:
+            except WebDriverException:
                 pass
         
         return ""
@@ -490,38 +559,19 @@ class TableRowExtractionStrategy(ExtractionStrategy):
     ) -> str:
         """Extract URL using JavaScript to inspect button attributes."""
         try:
-            js_code = """
-            var button = arguments[0];
-            var result = {};
-            
-            // Check various attributes that might contain the URL
-            result.dataUrl = button.getAttribute('data-url');
-            result.dataHref = button.getAttribute('data-href');
-            result.dataLink = button.getAttribute('data-link');
-            result.onclick = button.onclick ? button.onclick.toString() : null;
-            
-            // Check parent elements for data
-            var parent = button.parentElement;
-            if (parent) {
-                result.parentDataUrl = parent.getAttribute('data-url');
-                result.parentDataHref = parent.getAttribute('data-href');
-            }
-            
-            return result;
-            """
-            
-            result = driver.execute_script(js_code, button_element)
+            result = driver.execute_script(_CALL_INSPECT_BUTTON_JS, button_element)
+            if result is None:
+                # First use on this page, or the page has been reloaded since
+                result = driver.execute_script(_INSTALL_INSPECT_BUTTON_JS, button_element)
             
             # Check each possible URL source
             for key, value in result.items():
-                if value and ("youtube.com" in str(value) or "youtu.be" in str(value)):
-                    # Extract URL from the value
-                    url_pattern = r'https?://(?:www\.)?(youtube\.com|youtu\.be)/[^\s"\'>\)]+'
-                    urls = re.findall(url_pattern, str(value))
-                    if urls:
-                        found_url = f"https://{urls[0]}"
-                        self.logger.debug(f"Found YouTube URL via {key}: {found_url}")
-                        return found_url
+                # Values such as onclick hold code, so pull the URL out before checking its host
+                url_match = _YT_URL_RE.search(str(value)) if value else None
+                if url_match and is_youtube_url(url_match.group(0)):
+                    found_url = url_match.group(0)
+                    self.logger.debug(f"Found YouTube URL via {key}: {found_url}")
+                    return found_url
                         
         except Exception as e:
             self.logger.debug(f"JavaScript extraction failed: {e}")
@@ -530,48 +580,73 @@ class TableRowExtractionStrategy(ExtractionStrategy):
     
     def _extract_from_history_thumbnails(
         self, 
-        driver: "WebDriver",
+        history_urls: Dict[str, str],
         song_title: str
     ) -> str:
-        """Extract YouTube URL from history section thumbnails."""
-        try:
-            history_rows = driver.find_elements(
-                By.CSS_SELECTOR, "#input-content-history tbody tr"
+        """Extract YouTube URL from history section thumbnails.
+        
+        Args:
+            history_urls: History titles mapped to their videos' URLs, from
+                _build_history_url_map
+            song_title: Title of the song to look up
+            
+        Returns:
+            YouTube URL of the first matching history entry, or "" if none
+        """
+        youtube_url = history_urls.get(song_title)
+        if youtube_url is None:
+            youtube_url = next(
+                (
+                    url for history_title, url in history_urls.items()
+                    if self.song_matcher.titles_match(song_title, history_title)
+                ),
+                ""
             )
-            for history_row in history_rows:
-                try:
-                    # Get song title from history row
-                    history_title_element = history_row.find_element(
-                        By.CSS_SELECTOR, ".moobot-input-label-text-text"
+        
+        if youtube_url:
+            self.logger.info(
+                f"Found YouTube URL via history thumbnail: {youtube_url} "
+                f"for song: {song_title}"
+            )
+        return youtube_url
+    
+    def _build_history_url_map(self, driver: "WebDriver") -> Dict[str, str]:
+        """Map each history entry's title to the YouTube URL from its thumbnail."""
+        history_urls: Dict[str, str] = {}
+        try:
+            for history_title, img_src in self._read_history_thumbnails(driver):
+                # Extract video ID from thumbnail URL
+                video_id_match = _YT_VID_RE.search(img_src)
+                if video_id_match:
+                    # Earlier rows win, as when the table was scanned top to bottom
+                    history_urls.setdefault(
+                        history_title,
+                        f"https://www.youtube.com/watch?v={video_id_match.group(1)}"
                     )
-                    history_title = history_title_element.text.strip()
-                    
-                    # Check if this matches our song
-                    if self.song_matcher.titles_match(song_title, history_title):
-                        # Look for YouTube thumbnail
-                        img_element = history_row.find_element(
-                            By.CSS_SELECTOR, "img[src*='youtube.com']"
-                        )
-                        img_src = img_element.get_attribute("src")
-                        
-                        # Extract video ID from thumbnail URL
-                        video_id_match = re.search(r'/vi/([^/]+)/', img_src)
-                        if video_id_match:
-                            video_id = video_id_match.group(1)
-                            youtube_url = f"https://www.youtube.com/watch?v={video_id}"
-                            self.logger.info(
-                                f"Found YouTube URL via history thumbnail: {youtube_url} "
-                                f"for song: {song_title}"
-                            )
-                            return youtube_url
-                            
-                except Exception:
-                    continue
                     
         except Exception as e:
             self.logger.debug(f"History thumbnail method failed: {e}")
         
-        return ""
+        return history_urls
+    
+    def _read_history_thumbnails(self, driver: "WebDriver") -> List[Tuple[str, str]]:
+        """Get (title, thumbnail src) for each history row with a YouTube thumbnail."""
+        js_code = """
+        var rows = document.querySelectorAll('#input-content-history tbody tr');
+        var results = [];
+        
+        for (var i = 0; i < rows.length; i++) {
+            var titleElement = rows[i].querySelector('.moobot-input-label-text-text');
+            var img = rows[i].querySelector("img[src*='youtube.com']");
+            if (titleElement && img) {
+                results.push([(titleElement.innerText || '').trim(), img.getAttribute('src')]);
+            }
+        }
+        
+        return results;
+        """
+        
+        return [tuple(entry) for entry in driver.execute_script(js_code) or []]
     
     def _control_video_playback(
         self,
@@ -592,26 +667,13 @@ class TableRowExtractionStrategy(ExtractionStrategy):
             }
             """
             driver.execute_script(js_code, config.pause_videos, config.mute_audio)
-        except:
+        except WebDriverException:
             pass  # Ignore JavaScript errors
     
     def _search_youtube_url(self, song_title: str) -> str:
         """Generate a YouTube search URL for the song title."""
         try:
-            search_query = song_title.strip()
-            
-            # Remove common suffixes that might not be in YouTube titles
-            suffixes_to_remove = [
-                ' (Official Video)', ' (Official Audio)', ' (Official)', 
-                ' (Lyrics)', ' M/V'
-            ]
-            for suffix in suffixes_to_remove:
-                if search_query.endswith(suffix):
-                    search_query = search_query[:-len(suffix)].strip()
-                    break
-            
-            encoded_query = urllib.parse.quote_plus(search_query)
-            return f"https://www.youtube.com/results?search_query={encoded_query}"
+            return _youtube_search_url(song_title)
             
         except Exception as e:
             self.logger.debug(f"Error generating YouTube search URL: {e}")
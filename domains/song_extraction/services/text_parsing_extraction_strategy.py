@@ -1,18 +1,35 @@
 """Text parsing extraction strategy for fallback song extraction from raw text."""
 
+import string
 from datetime import datetime
-from typing import List, Optional, Set, TYPE_CHECKING
-from selenium.webdriver.common.by import By
+from typing import Callable, List, Optional, Set, Tuple, TYPE_CHECKING
 
 from .extraction_strategy import ExtractionStrategy
 from ..entities import ExtractionResult, ExtractionConfig, ElementSelector
+from ..entities.element_selector import SelectorType
 from domains.music_queue.entities import SongRequest
 from domains.music_queue.services import SongMatchingService
+from infrastructure.regex import compile_alternation
 
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webdriver import WebDriver
 
 
+# Line filters for _is_potential_song_line, built once instead of per line
+_NON_SONG_PREFIXES = ('http', 'www', 'ftp')
+_UI_WORDS = (
+    'click', 'toggle', 'menu', 'button', 'login', 'sign up',
+    'home', 'about', 'contact', 'help', 'settings'
+)
+_UI_WORD_RE = compile_alternation(_UI_WORDS)
+_NON_SONG_PHRASES = frozenset({
+    'loading', 'please wait', 'error', 'not found',
+    'no results', 'empty', 'none', 'null'
+})
+# Deletes ASCII letters and spaces, leaving the digits and special characters
+_ASCII_WORD_CHARS_TABLE = str.maketrans('', '', string.ascii_letters + ' ')
+
+
 class TextParsingExtractionStrategy(ExtractionStrategy):
     """Strategy for extracting songs from raw text content.
     
@@ -20,6 +37,9 @@ class TextParsingExtractionStrategy(ExtractionStrategy):
     from page text when other extraction methods fail or are insufficient.
     """
     
+    # Elements are looked up with By.CSS_SELECTOR
+    SUPPORTED_SELECTOR_TYPES = frozenset({SelectorType.CSS})
+    
     def __init__(self):
         super().__init__("text_parsing")
         self.song_matcher = SongMatchingService()
@@ -43,6 +63,10 @@ class TextParsingExtractionStrategy(ExtractionStrategy):
         config: ExtractionConfig
     ) -> ExtractionResult:
         """Extract songs from page text content."""
+        skipped = self._skipped_result(selector, config)
+        if skipped is not None:
+            return skipped
+        
         try:
             return self._extract_songs_from_text(driver, selector, config)
                 
@@ -61,49 +85,41 @@ class TextParsingExtractionStrategy(ExtractionStrategy):
         config: ExtractionConfig
     ) -> ExtractionResult:
         """Extract songs by parsing text content."""
-        songs = []
         current_time = datetime.now()
         
         try:
             # Get page text content
             if selector.selector == "body" or selector.selector == "*":
-                # Get all page text
-                page_text = driver.find_element(By.TAG_NAME, "body").text
+                # Get the page's candidate lines, filtered in the browser
+                text_length, line_count, numbered_lines = self._read_body_lines(
+                    driver, config
+                )
             else:
                 # Get text from specific elements
-                elements = driver.find_elements(By.CSS_SELECTOR, selector.selector)
-                page_text = "\n".join([elem.text for elem in elements if elem.text.strip()])
+                elements = self.find_elements(driver, selector, config)
+                texts = [elem.text for elem in elements]
+                page_text = "\n".join([text for text in texts if text.strip()])
+                
+                lines = page_text.split('\n')
+                text_length, line_count = len(page_text), len(lines)
+                numbered_lines = list(enumerate(lines))
             
             element_count = 1  # We're processing the combined text as one unit
             
             # Parse songs from the text
-            song_dicts = self._parse_text_for_songs(page_text, config, current_time)
-            
-            # Convert to SongRequest objects
-            for song_dict in song_dicts:
-                try:
-                    song_request = SongRequest.from_dict(song_dict)
-                    songs.append(song_request)
-                    
-                    # Apply limit if configured
-                    if (config.max_songs_per_strategy and 
-                        len(songs) >= config.max_songs_per_strategy):
-                        break
-                        
-                except ValueError as e:
-                    self.logger.warning(f"Invalid song data from text parsing: {e}")
-                    continue
+            songs = self._parse_lines_for_songs(numbered_lines, config, current_time)
             
             result = ExtractionResult.create_success(
                 songs=songs,
                 strategy_used=self.name,
                 selector_used=selector.selector,
-                element_count=element_count
+                element_count=element_count,
+                timestamp=current_time
             )
             
             # Add metadata about text processing
-            result.add_metadata("text_length", len(page_text))
-            result.add_metadata("lines_processed", len(page_text.split('\n')))
+            result.add_metadata("text_length", text_length)
+            result.add_metadata("lines_processed", line_count)
             
             return result
             
@@ -111,107 +127,174 @@ class TextParsingExtractionStrategy(ExtractionStrategy):
             return ExtractionResult.create_failure(
                 error_message=str(e),
                 strategy_used=self.name,
-                selector_used=selector.selector
+                selector_used=selector.selector,
+                timestamp=current_time
             )
     
-    def _parse_text_for_songs(
+    def _read_body_lines(
+        self,
+        driver: "WebDriver",
+        config: ExtractionConfig
+    ) -> Tuple[int, int, List[Tuple[int, str]]]:
+        """Read the page's stripped text lines that are long enough to be titles.
+        
+        Only those lines cross the wire, rather than the whole body text.
+        
+        Returns:
+            The body text's length, its number of lines, and the candidate
+            lines paired with their line numbers
+        """
+        js_code = """
+        var text = document.body.innerText || '';
+        var lines = text.split('\\n');
+        var candidates = [];
+        
+        for (var i = 0; i < lines.length; i++) {
+            var line = lines[i].trim();
+            if (line && line.length >= arguments[0]) {
+                candidates.push([i, line]);
+            }
+        }
+        
+        return {text_length: text.length, line_count: lines.length, lines: candidates};
+        """
+        
+        body = driver.execute_script(js_code, config.min_title_length)
+        return (
+            body["text_length"],
+            body["line_count"],
+            [(line_num, line) for line_num, line in body["lines"]]
+        )
+    
+    def _parse_lines_for_songs(
         self, 
-        text: str, 
+        numbered_lines: List[Tuple[int, str]], 
         config: ExtractionConfig,
         current_time: datetime
-    ) -> List[dict]:
-        """Parse songs from page text content."""
+    ) -> List[SongRequest]:
+        """Parse songs from page text lines paired with their line numbers.
+        
+        Stops at config.max_songs_per_strategy songs, if set, so lines after
+        the limit are never cleaned or filtered.
+        """
         songs = []
+        seen_titles: Set[Tuple[str, str]] = set()
+        _, scraped_at = self.format_timestamps(current_time)
         
-        if not text or len(text.strip()) == 0:
-            return songs
+        # Limit results to prevent too many false positives
+        max_songs = 50  # Reasonable default limit
+        if config.max_songs_per_strategy is not None:
+            max_songs = min(max_songs, config.max_songs_per_strategy)
         
-        lines = text.split('\n')
-        seen_titles: Set[str] = set()
+        # Loop invariants, read once rather than once per line
+        is_potential_song_line = self._line_filter(config)
+        min_title_length = config.min_title_length
+        max_title_length = config.max_title_length
+        clean_titles = config.clean_titles
+        skip_ui_text = config.skip_ui_text
+        clean_song_title = self.song_matcher.clean_song_title
+        is_ui_text = self.song_matcher.is_ui_text
+        dedup_key = self.song_matcher.dedup_key
         
-        for line_num, line in enumerate(lines):
+        for line_num, line in numbered_lines:
             line = line.strip()
             
             # Apply basic filtering
-            if not self._is_potential_song_line(line, config):
+            if not is_potential_song_line(line):
                 continue
             
             # Clean the line if configured
-            if config.clean_titles:
-                clean_line = self.song_matcher.clean_song_title(line)
+            if clean_titles:
+                clean_line = clean_song_title(line)
             else:
                 clean_line = line
             
             # Apply length and content filters
-            if len(clean_line) < config.min_title_length:
+            if len(clean_line) < min_title_length:
                 continue
                 
-            if len(clean_line) > config.max_title_length:
+            if len(clean_line) > max_title_length:
                 continue
                 
-            if config.skip_ui_text and self.song_matcher.is_ui_text(clean_line):
+            if skip_ui_text and is_ui_text(clean_line):
                 continue
             
-            # Avoid duplicates
-            clean_lower = clean_line.lower()
-            if clean_lower in seen_titles:
+            # Avoid duplicates, including variants that differ only in case,
+            # punctuation or a suffix like "(Official)"
+            title_key = dedup_key(clean_line)
+            if title_key in seen_titles:
                 continue
             
-            seen_titles.add(clean_lower)
-            
-            song_info = {
-                "title": clean_line,
-                "youtube_url": "",  # Text parsing doesn't extract URLs
-                "timestamp": current_time.isoformat(),
-                "scraped_at": current_time.strftime("%Y-%m-%d %H:%M:%S"),
-                "selector_used": "text_parsing",
-                "element_index": line_num,
-                "metadata": {
-                    "source_line": line_num + 1,
-                    "original_text": line
-                }
-            }
-            songs.append(song_info)
+            seen_titles.add(title_key)
+            
+            try:
+                songs.append(SongRequest(
+                    title=clean_line,
+                    youtube_url="",  # Text parsing doesn't extract URLs
+                    timestamp=current_time,
+                    scraped_at=scraped_at,
+                    selector_used="text_parsing",
+                    element_index=line_num
+                ))
+            except ValueError as e:
+                self.logger.warning(f"Invalid song data from text parsing: {e}")
+                continue
             
-            # Limit results to prevent too many false positives
-            if len(songs) >= 50:  # Reasonable default limit
+            if len(songs) >= max_songs:
                 break
         
         return songs
     
     def _is_potential_song_line(self, line: str, config: ExtractionConfig) -> bool:
         """Check if a line of text might be a song title."""
-        if not line or len(line.strip()) < config.min_title_length:
-            return False
+        return self._line_filter(config)(line)
+    
+    def _line_filter(self, config: ExtractionConfig) -> Callable[[str], bool]:
+        """Get a function that checks if a line of text might be a song title.
         
-        # Skip lines that are clearly not songs
-        skip_patterns = [
-            # URLs and technical content
-            lambda l: l.startswith(('http', 'www', 'ftp')),
-            
-            # UI elements and navigation
-            lambda l: any(ui_word in l.lower() for ui_word in [
-                'click', 'toggle', 'menu', 'button', 'login', 'sign up',
-                'home', 'about', 'contact', 'help', 'settings'
-            ]),
+        The config's minimum length and the module's patterns are bound to
+        the returned function, which runs once per line of page text.
+        """
+        # Very short lines (likely not song titles) fail either minimum
+        min_length = max(config.min_title_length, 5)
+        non_song_prefixes = _NON_SONG_PREFIXES
+        non_song_phrases = _NON_SONG_PHRASES
+        search_ui_words = _UI_WORD_RE.search
+        ascii_word_chars_table = _ASCII_WORD_CHARS_TABLE
+        
+        def is_potential_song_line(line: str) -> bool:
+            # Skip lines that are clearly not songs, cheapest checks first
+            if len(line.strip()) < min_length:
+                return False
             
-            # Very short lines (likely not song titles)
-            lambda l: len(l.strip()) < 5,
+            # URLs and technical content
+            if line.startswith(non_song_prefixes):
+                return False
             
-            # Lines with lots of numbers/special chars (likely not songs)
-            lambda l: sum(c.isdigit() or not c.isalnum() and c != ' ' for c in l) > len(l) // 2,
+            lower = line.lower()
             
             # Common non-song phrases
-            lambda l: l.lower().strip() in [
-                'loading', 'please wait', 'error', 'not found', 
-                'no results', 'empty', 'none', 'null'
-            ],
+            if lower.strip() in non_song_phrases:
+                return False
+            
+            # UI elements and navigation
+            if search_ui_words(lower):
+                return False
             
             # Very repetitive content
-            lambda l: len(set(l.lower().split())) < max(1, len(l.split()) // 3)
-        ]
+            if len(set(lower.split())) < max(1, len(line.split()) // 3):
+                return False
+            
+            # Lines with lots of numbers/special chars (likely not songs)
+            if line.isascii():
+                special_count = len(line.translate(ascii_word_chars_table))
+            else:
+                special_count = sum(
+                    c.isdigit() or not c.isalnum() and c != ' ' for c in line
+                )
+            return special_count <= len(line) // 2
         
-        return not any(pattern(line) for pattern in skip_patterns)
+        return is_potential_song_line
     
     def validate_config(self, config: ExtractionConfig) -> bool:
         """Validate configuration for text parsing extraction."""
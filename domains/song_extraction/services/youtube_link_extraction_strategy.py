@@ -1,11 +1,12 @@
 """YouTube link extraction strategy for finding songs via YouTube links."""
 
+import re
 from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING
-from selenium.webdriver.common.by import By
 
-from .extraction_strategy import ExtractionStrategy
+from .extraction_strategy import ExtractionStrategy, VISIBLE_TEXT_JS, is_youtube_url
 from ..entities import ExtractionResult, ExtractionConfig, ElementSelector
+from ..entities.element_selector import SelectorType
 from domains.music_queue.entities import SongRequest
 from domains.music_queue.services import SongMatchingService
 
@@ -13,6 +14,15 @@ if TYPE_CHECKING:
     from selenium.webdriver.remote.webdriver import WebDriver
 
 
+# Video ID patterns for the different YouTube URL formats, tried in order
+_VIDEO_ID_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(?:youtube\.com/watch\?v=)([^&\n?#]+)',
+    r'(?:youtu\.be/)([^&\n?#]+)',
+    r'(?:youtube\.com/embed/)([^&\n?#]+)',
+    r'(?:youtube\.com/v/)([^&\n?#]+)'
+))
+
+
 class YouTubeLinkExtractionStrategy(ExtractionStrategy):
     """Strategy for extracting songs specifically from YouTube links.
     
@@ -20,6 +30,9 @@ class YouTubeLinkExtractionStrategy(ExtractionStrategy):
     on the page, either as standalone links or embedded in other elements.
     """
     
+    # Elements are looked up with By.CSS_SELECTOR
+    SUPPORTED_SELECTOR_TYPES = frozenset({SelectorType.CSS})
+    
     def __init__(self):
         super().__init__("youtube_link")
         self.song_matcher = SongMatchingService()
@@ -43,6 +56,10 @@ class YouTubeLinkExtractionStrategy(ExtractionStrategy):
         config: ExtractionConfig
     ) -> ExtractionResult:
         """Extract songs from YouTube links."""
+        skipped = self._skipped_result(selector, config)
+        if skipped is not None:
+            return skipped
+        
         try:
             return self._extract_songs_from_links(driver, selector, config)
                 
@@ -65,21 +82,21 @@ class YouTubeLinkExtractionStrategy(ExtractionStrategy):
         current_time = datetime.now()
         
         try:
-            # Find YouTube links using the selector
-            youtube_links = driver.find_elements(By.CSS_SELECTOR, selector.selector)
+            # Read every YouTube link in one browser round-trip
+            youtube_links = self._bulk_extract_links(driver, selector.selector)
             element_count = len(youtube_links)
             
-            for i, link in enumerate(youtube_links):
+            for i, link_data in enumerate(youtube_links):
                 try:
                     song_info = self._extract_from_youtube_link(
-                        link, i, current_time, selector.selector, config
+                        link_data, i, current_time, selector.selector, config
                     )
                     if song_info:
                         song_request = SongRequest.from_dict(song_info)
                         songs.append(song_request)
                         
                         # Apply limit if configured
-                        if (config.max_songs_per_strategy and 
+                        if (config.max_songs_per_strategy is not None and 
                             len(songs) >= config.max_songs_per_strategy):
                             break
                         
@@ -94,42 +111,67 @@ class YouTubeLinkExtractionStrategy(ExtractionStrategy):
                 songs=songs,
                 strategy_used=self.name,
                 selector_used=selector.selector,
-                element_count=element_count
+                element_count=element_count,
+                timestamp=current_time
             )
             
         except Exception as e:
             return ExtractionResult.create_failure(
                 error_message=str(e),
                 strategy_used=self.name,
-                selector_used=selector.selector
+                selector_used=selector.selector,
+                timestamp=current_time
             )
     
+    def _bulk_extract_links(self, driver: "WebDriver", selector: str) -> List[dict]:
+        """Read the href, text and, when needed, parent text of every link in one script call."""
+        js_code = VISIBLE_TEXT_JS + """
+        var links = document.querySelectorAll(arguments[0]);
+        var results = [];
+        
+        for (var i = 0; i < links.length; i++) {
+            var link = links[i];
+            var href = link.href || link.getAttribute('href');
+            var text = visibleText(link);
+            
+            // The parent's text is only used when the link's own text is no title
+            var parentText = null;
+            if ((!text || (href && text.indexOf(href) !== -1)) && link.parentElement) {
+                parentText = visibleText(link.parentElement);
+            }
+            
+            results.push({href: href, text: text, parent_text: parentText});
+        }
+        
+        return results;
+        """
+        
+        return driver.execute_script(js_code, selector) or []
+    
     def _extract_from_youtube_link(
         self,
-        link_element,
+        link_data: dict,
         index: int,
         current_time: datetime,
         selector_used: str,
         config: ExtractionConfig
     ) -> Optional[dict]:
-        """Extract song info from a YouTube link element."""
+        """Extract song info from one link read by _bulk_extract_links."""
         try:
-            href = link_element.get_attribute("href")
-            if not href or not ("youtube.com" in href or "youtu.be" in href):
+            href = link_data["href"]
+            if not is_youtube_url(href):
                 return None
             
-            title = link_element.text.strip()
+            title = link_data["text"]
             
             # If link text is empty or just URL, try to get title from parent element
             if not title or href in title:
-                try:
-                    parent = link_element.find_element(By.XPATH, "..")
-                    title = parent.text.strip()
-                    # Remove the URL from the title if it's there
-                    if href in title:
-                        title = title.replace(href, "").strip()
-                except:
+                title = link_data["parent_text"]
+                if title is None:
                     title = "Unknown Song"
+                # Remove the URL from the title if it's there
+                elif href in title:
+                    title = title.replace(href, "").strip()
             
             # Clean title if configured
             if config.clean_titles:
@@ -151,11 +193,13 @@ class YouTubeLinkExtractionStrategy(ExtractionStrategy):
             if video_id:
                 metadata["video_id"] = video_id
             
+            timestamp_iso, scraped_at = self.format_timestamps(current_time)
+            
             return {
                 "title": title,
                 "youtube_url": href,
-                "timestamp": current_time.isoformat(),
-                "scraped_at": current_time.strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": timestamp_iso,
+                "scraped_at": scraped_at,
                 "selector_used": selector_used,
                 "element_index": index,
                 "metadata": metadata
@@ -168,18 +212,8 @@ class YouTubeLinkExtractionStrategy(ExtractionStrategy):
     def _extract_video_id(self, youtube_url: str) -> Optional[str]:
         """Extract YouTube video ID from URL."""
         try:
-            import re
-            
-            # Handle different YouTube URL formats
-            patterns = [
-                r'(?:youtube\.com/watch\?v=)([^&\n?#]+)',
-                r'(?:youtu\.be/)([^&\n?#]+)',
-                r'(?:youtube\.com/embed/)([^&\n?#]+)',
-                r'(?:youtube\.com/v/)([^&\n?#]+)'
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, youtube_url)
+            for pattern in _VIDEO_ID_PATTERNS:
+                match = pattern.search(youtube_url)
                 if match:
                     return match.group(1)
             
@@ -4,13 +4,19 @@ Core entities for web scraping sessions, extraction results,
 and related value objects.
 """
 
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from selenium.webdriver.remote.webdriver import WebDriver
 from domains.music_queue.entities import SongRequest, StreamerId
 
+# Video IDs run up to the query string for short links, and up to the next
+# query parameter for watch links
+_SHORT_LINK_ID_RE = re.compile(r'youtu\.be/([^?]*)')
+_WATCH_LINK_ID_RE = re.compile(r'watch\?v=([^&]*)')
+
 
 @dataclass
 class ExtractionSession:
@@ -63,13 +69,25 @@ class ExtractionSession:
 
 @dataclass(frozen=True)
 class ExtractionResult:
-    """Result of a web extraction operation."""
+    """Result of a web extraction operation.
+    
+    Songs are stored as a tuple so the result stays fixed once built.
+    """
     
-    songs: List[SongRequest]
+    songs: Tuple[SongRequest, ...]
     success: bool
     strategy_used: str
     debug_info: Dict[str, Any] = field(default_factory=dict)
     extraction_time: datetime = field(default_factory=datetime.now)
+    _youtube_song_count: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Store the songs as a tuple and count YouTube songs once."""
+        songs = tuple(self.songs)
+        object.__setattr__(self, 'songs', songs)
+        object.__setattr__(
+            self, '_youtube_song_count', sum(1 for song in songs if song.has_youtube_link)
+        )
     
     @property
     def song_count(self) -> int:
@@ -84,10 +102,10 @@ class ExtractionResult:
     @property
     def youtube_song_count(self) -> int:
         """Get count of songs with YouTube links."""
-        return sum(1 for song in self.songs if song.has_youtube_link)
+        return self._youtube_song_count
     
     @classmethod
-    def success_result(cls, songs: List[SongRequest], strategy_used: str, 
+    def success_result(cls, songs: Sequence[SongRequest], strategy_used: str, 
                       debug_info: Dict[str, Any] = None) -> 'ExtractionResult':
         """Create a successful extraction result."""
         return cls(
@@ -138,15 +156,10 @@ class YouTubeUrl:
         if not self.is_direct_video:
             return None
             
-        try:
-            if "youtu.be/" in self.url:
-                return self.url.split("youtu.be/")[1].split("?")[0]
-            elif "watch?v=" in self.url:
-                return self.url.split("watch?v=")[1].split("&")[0]
-        except (IndexError, AttributeError):
-            pass
-            
-        return None
+        match = (
+            _SHORT_LINK_ID_RE.search(self.url) or _WATCH_LINK_ID_RE.search(self.url)
+        )
+        return match.group(1) if match else None
     
     def __str__(self) -> str:
         return self.url
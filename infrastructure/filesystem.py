@@ -8,6 +8,12 @@ import json
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+try:
+    # Optional: much faster JSON encoding/decoding when installed
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class FileSystemManager:
     """Manages file system operations for the scraper."""
@@ -31,6 +37,9 @@ class FileSystemManager:
         """
         if file_path.exists():
             try:
+                if orjson is not None:
+                    with open(file_path, 'rb') as f:
+                        return orjson.loads(f.read())
                 with open(file_path, 'r', encoding='utf-8') as f:
                     return json.load(f)
             except Exception as e:
@@ -50,6 +59,10 @@ class FileSystemManager:
             FileOperationError: If saving fails
         """
         try:
+            if orjson is not None:
+                with open(file_path, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                return
             with open(file_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
         except Exception as e:
@@ -38,6 +38,10 @@ class UnicodeLogger:
             elif level == 'debug':
                 self.logger.debug(f"[Unicode characters replaced] {safe_message}")
     
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether messages at the given level would be logged."""
+        return self.logger.isEnabledFor(level)
+    
     def info(self, message: str) -> None:
         """Log info message safely."""
         self.safe_log('info', message)
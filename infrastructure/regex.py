@@ -0,0 +1,27 @@
+"""Regular expression infrastructure for Moobot scraper.
+
+Builds the word-list patterns used for UI text detection, using the
+linear-time re2 engine when it is installed.
+"""
+
+import re
+from typing import Iterable, Pattern
+
+try:
+    # Optional: DFA-based matching for word-list scans when installed
+    import re2
+except ImportError:
+    re2 = None
+
+
+def compile_alternation(words: Iterable[str]) -> Pattern:
+    """Compile a pattern matching any of the given words as literal text.
+
+    Args:
+        words: Words or phrases to match
+
+    Returns:
+        Compiled pattern from re2 if available, otherwise from re
+    """
+    engine = re2 or re
+    return engine.compile("|".join(engine.escape(word) for word in words))
@@ -23,7 +23,7 @@ from infrastructure.logging import setup_logging, UnicodeLogger
 from infrastructure.filesystem import setup_directories
 
 # Import domain modules
-from domains.music_queue import SongRequest, StreamerId, SongMatchingService, QueueRepository
+from domains.music_queue import SongRequest, StreamerId, SongMatchingService, QueueRepository, frozen_now
 from domains.content_publishing import SongCollection, PublishingConfig, ContentPublisher
 from domains.song_extraction import ExtractionCoordinator, ExtractionConfig, ElementSelector, ExtractionResult
 
@@ -459,18 +459,9 @@ class MoobotScraper:
     
     def update_songs_data(self, new_songs: List[Dict]):
         """Update the songs data with new entries."""
-        # Convert dictionaries to SongRequest objects
-        song_requests = []
-        for song_dict in new_songs:
-            try:
-                song_request = SongRequest.from_dict(song_dict)
-                song_requests.append(song_request)
-            except ValueError as e:
-                self.logger.warning(f"Skipping invalid song: {e}")
-                continue
-        
-        # Add songs using domain repository
-        new_count = self.queue_repository.add_new_songs(song_requests)
+        # Songs are already in storage format, so add them without
+        # a round-trip through SongRequest
+        new_count = self.queue_repository.add_new_songs(new_songs)
         
         if new_count > 0:
             # Update backward compatibility data
@@ -495,13 +486,14 @@ class MoobotScraper:
                 
                 # Convert dictionaries to SongRequest objects
                 songs = []
-                for song_dict in songs_dicts:
-                    try:
-                        song = SongRequest.from_dict(song_dict)
-                        songs.append(song)
-                    except ValueError as e:
-                        self.logger.warning(f"Skipping invalid song in {date_str}: {e}")
-                        continue
+                with frozen_now():
+                    for song_dict in songs_dicts:
+                        try:
+                            song = SongRequest.from_dict(song_dict)
+                            songs.append(song)
+                        except ValueError as e:
+                            self.logger.warning(f"Skipping invalid song in {date_str}: {e}")
+                            continue
                 
                 # Create SongCollection
                 collection = SongCollection(
@@ -523,8 +515,8 @@ class MoobotScraper:
                 self.logger.error(f"Publishing error: {error}")
     
     def save_data(self):
-        """Save songs data - now handled by repository."""
-        pass  # Repository handles saving automatically
+        """Save songs data by flushing pending repository changes."""
+        self.queue_repository.flush()
             
     def run_scan(self):
         """Run a single scan cycle."""
@@ -537,6 +529,7 @@ class MoobotScraper:
                 for song in songs[:5]:  # Log first few songs
                     self.logger.info(f"  - {song['title']} [{song.get('selector_used', 'unknown')}]")
                 self.update_songs_data(songs)
+                self.save_data()
             else:
                 self.logger.warning("No songs found in this scan")
                 
@@ -609,7 +602,8 @@ class MoobotScraper:
             self.logger.error(f"Unexpected error: {e}")
         finally:
             try:
-                self.save_data()
+                # Block until the data is on disk before cleaning up
+                self.queue_repository.flush(wait=True)
                 self.generate_html()
                 self.logger.info("Final data save completed.")
             except Exception as e:
@@ -46,6 +46,12 @@ def test_publishing_entities():
     print(f"  ✓ Song count: {collection.song_count}")
     print(f"  ✓ YouTube songs: {collection.has_youtube_songs}")
     
+    # YouTube songs follow changes to the song list
+    collection.songs.append(SongRequest(title="Yesterday", youtube_url="https://youtu.be/NrgmdOz227I"))
+    assert collection.has_youtube_songs == 2
+    assert [song.title for song in collection.get_songs_with_youtube()] == ["Bohemian Rhapsody", "Yesterday"]
+    print(f"  ✓ YouTube songs after append: {collection.has_youtube_songs}")
+    
     # Test PublishingConfig
     config = PublishingConfig(
         output_dir=Path("test_output"),
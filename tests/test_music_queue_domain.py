@@ -3,13 +3,19 @@
 Test script for Music Queue domain entities and services
 """
 
+import json
 import sys
+import tempfile
+from datetime import date
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from domains.music_queue import SongRequest, StreamerId, SongMatchingService
+from domains.music_queue import SongRequest, StreamerId, SongMatchingService, QueueRepository
+from domains.music_queue.services import _close_open_repositories
+from infrastructure.filesystem import FileOperationError
+from infrastructure.logging import UnicodeLogger
 
 def test_song_request():
     """Test SongRequest entity."""
@@ -31,6 +37,12 @@ def test_song_request():
     song_dict = song.to_dict()
     song_from_dict = SongRequest.from_dict(song_dict)
     print(f"  ✓ Dict conversion: {song.title == song_from_dict.title}")
+    
+    # The lowercased title follows changes to the title
+    assert song.title_ci == "bohemian rhapsody"
+    song.title = "Under Pressure"
+    assert song.title_ci == "under pressure"
+    print(f"  ✓ Lowercased title follows title: {song.title_ci}")
 
 def test_streamer_id():
     """Test StreamerId entity."""
@@ -53,6 +65,26 @@ def test_song_matching():
     match = matcher.titles_match(title1, title2)
     print(f"  ✓ Title matching: '{title1}' vs '{title2}' = {match}")
     
+    # Test batch matching against several candidates
+    candidates = [SongRequest(title="Stairway to Heaven"), SongRequest(title=title2)]
+    match_any = matcher.match_any(SongRequest(title=title1), candidates)
+    print(f"  ✓ Batch matching: '{title1}' vs {len(candidates)} candidates = {match_any}")
+    
+    # Test duplicate keys: punctuation and suffix variants merge...
+    variant1 = "Pachelbel - Canon in D"
+    variant2 = "Pachelbel – Canon in D (Official)"
+    assert matcher.dedup_key(variant1) == matcher.dedup_key(variant2)
+    print(f"  ✓ Dedup key: '{variant1}' == '{variant2}'")
+    
+    # ...but titles differing in non-ASCII characters stay distinct
+    for distinct1, distinct2 in [
+        ("YOASOBI - 夜に駆ける", "YOASOBI - アイドル"),
+        ("夜に駆ける", "アイドル"),
+        ("Café Song", "Caf Song"),
+    ]:
+        assert matcher.dedup_key(distinct1) != matcher.dedup_key(distinct2)
+        print(f"  ✓ Dedup key: '{distinct1}' != '{distinct2}'")
+    
     # Test UI text detection
     ui_text = "Click here to view more"
     song_text = "Stairway to Heaven"
@@ -64,6 +96,92 @@ def test_song_matching():
     clean_title = matcher.clean_song_title(messy_title)
     print(f"  ✓ Title cleaning: '{messy_title}' → '{clean_title}'")
 
+def test_queue_repository_writes():
+    """Test QueueRepository's deferred, immediate and retried writes."""
+    print("\n💾 Testing QueueRepository writes...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_file = Path(temp_dir) / "songs.json"
+        repository = QueueRepository(data_file, UnicodeLogger())
+        day = date(2024, 1, 1)
+        
+        def stored_titles():
+            with open(data_file, encoding='utf-8') as f:
+                return [song["title"] for song in json.load(f)[day.isoformat()]]
+        
+        # Deferred: nothing is written, or even started, until flush()
+        repository.save_daily_queue(day, [SongRequest(title="Deferred Song")])
+        assert not data_file.exists() and repository._writer is None
+        repository.flush(wait=True)
+        assert stored_titles() == ["Deferred Song"]
+        print("  ✓ Deferred write lands on flush(wait=True)")
+        
+        # Immediate: written before save_daily_queue returns
+        repository.save_daily_queue(day, [SongRequest(title="Immediate Song")], immediate=True)
+        assert stored_titles() == ["Immediate Song"]
+        print("  ✓ Immediate write lands before returning")
+        
+        # A failed write keeps the changes pending for the next flush
+        save_json_data = repository.fs_manager.save_json_data
+        
+        def fail_once(data, file_path):
+            repository.fs_manager.save_json_data = save_json_data
+            raise FileOperationError("disk full")
+        
+        repository.fs_manager.save_json_data = fail_once
+        repository.save_daily_queue(day, [SongRequest(title="Retried Song")], immediate=True)
+        assert stored_titles() == ["Immediate Song"]
+        repository.flush(wait=True)
+        assert stored_titles() == ["Retried Song"]
+        print("  ✓ Failed write is retried by the next flush")
+        
+        # close() stops the writer thread
+        writer = repository._writer
+        repository.close()
+        assert repository._writer is None and not writer.is_alive()
+        print("  ✓ close() stops the writer thread")
+        
+        # Changes that were never flushed are written by the exit hook
+        unflushed_file = Path(temp_dir) / "unflushed.json"
+        unflushed = QueueRepository(unflushed_file, UnicodeLogger())
+        unflushed.save_daily_queue(day, [SongRequest(title="Unflushed Song")])
+        _close_open_repositories()
+        with open(unflushed_file, encoding='utf-8') as f:
+            assert [song["title"] for song in json.load(f)[day.isoformat()]] == ["Unflushed Song"]
+        print("  ✓ Exit hook writes changes that were never flushed")
+
+def test_queue_repository_add_new_songs():
+    """Test QueueRepository.add_new_songs input checks and duplicate filtering."""
+    print("\n➕ Testing QueueRepository.add_new_songs...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        repository = QueueRepository(Path(temp_dir) / "songs.json", UnicodeLogger())
+        day = date(2024, 1, 1)
+        
+        added = repository.add_new_songs([
+            SongRequest(title="Valid Song"),
+            SongRequest(title="Stored Song").to_dict(),
+            {"title": "valid song"},
+            {"title": "   "},
+            {"duration": "3:00"},
+            {"title": "Bad Timestamp", "timestamp": "yesterday"},
+        ], day)
+        
+        assert added == 2
+        assert [song["title"] for song in repository.get_all_songs_data()[day.isoformat()]] == [
+            "Valid Song", "Stored Song"
+        ]
+        print(f"  ✓ Added {added} songs, skipped invalid dicts and duplicates")
+        
+        try:
+            repository.save_daily_queue(day, [{"title": ""}])
+            assert False, "save_daily_queue accepted a dict without a title"
+        except ValueError:
+            pass
+        assert len(repository.get_all_songs_data()[day.isoformat()]) == 2
+        print("  ✓ save_daily_queue rejects dicts without a title")
+        repository.close()
+
 if __name__ == "__main__":
     print("🧪 Testing Music Queue Domain")
     print("=" * 40)
@@ -71,5 +189,7 @@ if __name__ == "__main__":
     test_song_request()
     test_streamer_id()
     test_song_matching()
+    test_queue_repository_writes()
+    test_queue_repository_add_new_songs()
     
     print("\n✅ All domain tests passed!")
\ No newline at end of file
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test script for Song Extraction domain strategies
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from domains.song_extraction import ExtractionConfig, ElementSelector
+from domains.song_extraction.services import (
+    TableRowExtractionStrategy,
+    GeneralElementExtractionStrategy,
+    YouTubeLinkExtractionStrategy,
+    TextParsingExtractionStrategy
+)
+from domains.song_extraction.services.extraction_strategy import is_youtube_url
+
+class UntouchedDriver:
+    """Driver stand-in that fails the test if a strategy uses it."""
+    
+    def __getattr__(self, name):
+        raise AssertionError(f"driver.{name} used while extraction is switched off")
+
+def test_zero_song_limit():
+    """Test that a song limit of 0 skips extraction in every strategy."""
+    print("🚫 Testing max_songs_per_strategy=0...")
+    
+    config = ExtractionConfig(max_songs_per_strategy=0)
+    cases = [
+        (TableRowExtractionStrategy(), ElementSelector.create_table_row()),
+        (GeneralElementExtractionStrategy(), ElementSelector(selector=".song")),
+        (YouTubeLinkExtractionStrategy(), ElementSelector.create_youtube_links()),
+        (TextParsingExtractionStrategy(), ElementSelector(selector="body")),
+    ]
+    
+    for strategy, selector in cases:
+        result = strategy.extract_songs(UntouchedDriver(), selector, config)
+        assert result.success and result.song_count == 0 and result.element_count == 0
+        assert result.strategy_used == strategy.name
+        print(f"  ✓ {strategy.name} returns no songs without touching the page")
+
+def test_youtube_url_check():
+    """Test that YouTube links are recognised by their host."""
+    print("\n🔗 Testing YouTube URL check...")
+    
+    for url in [
+        "https://www.youtube.com/watch?v=fJ9rUzIMcZQ",
+        "https://youtube.com/watch?v=fJ9rUzIMcZQ",
+        "https://music.youtube.com/watch?v=fJ9rUzIMcZQ",
+        "https://youtu.be/fJ9rUzIMcZQ",
+    ]:
+        assert is_youtube_url(url), url
+    print("  ✓ YouTube hosts match")
+    
+    for url in [
+        None,
+        "",
+        "https://notyoutube.com.evil/watch?v=x",
+        "https://example.com/?ref=youtube.com",
+        "function() { open('https://youtu.be/x') }",
+    ]:
+        assert not is_youtube_url(url), url
+    print("  ✓ URLs that only mention YouTube don't match")
+
+if __name__ == "__main__":
+    print("🧪 Testing Song Extraction Domain")
+    print("=" * 40)
+    
+    test_zero_song_limit()
+    test_youtube_url_check()
+    
+    print("\n✅ All song extraction tests passed!")